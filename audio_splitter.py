@@ -19,15 +19,39 @@ Usage:
         --output /path/to/output_folder
 """
 import os
+import re
+import sys
 import argparse
 import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from tqdm import tqdm
 import time
 import math
 import pdb
 
+# Input formats this script splits, compared against the lowercased extension
+AUDIO_SUFFIXES = frozenset({".m4a", ".opus"})
+# Same set as one compiled, case-insensitive match on the name's tail
+AUDIO_NAME_RE = re.compile(
+    "(?:%s)\\Z" % "|".join(re.escape(s) for s in sorted(AUDIO_SUFFIXES)), re.IGNORECASE
+)
+
 def get_duration(file_path):
-    """Get duration of an audio file in seconds using ffprobe."""
+    """Get duration of an audio file in seconds.
+
+    Reads the container header in-process with mutagen when it's installed
+    (no ffprobe fork per call), falling back to ffprobe for containers
+    mutagen can't parse or when it's missing.
+    """
+    try:
+        import mutagen
+        audio = mutagen.File(file_path)
+        if audio is not None and audio.info.length:
+            return float(audio.info.length)
+    except Exception:
+        pass
+    
     cmd = [
         "ffprobe", 
         "-v", "error", 
@@ -38,8 +62,14 @@ def get_duration(file_path):
     result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
     return float(result.stdout.strip())
 
-def split_audio_file(file_path, output_dir, segment_length, output_format):
-    """Split an audio file into segments of specified length."""
+def split_audio_file(file_path, output_dir, segment_length, output_format, progress=True,
+                     log=print):
+    """Split an audio file into segments of specified length.
+
+    With `progress`, a tqdm bar follows ffmpeg's position in the input
+    (terminals only). Interrupting the split stops ffmpeg too. Messages
+    go through `log` (default: print).
+    """
     # Create output folder if it doesn't exist
     os.makedirs(output_dir, exist_ok=True)
     
@@ -52,32 +82,92 @@ def split_audio_file(file_path, output_dir, segment_length, output_format):
     # Calculate number of segments
     num_segments = math.ceil(duration / segment_length)
     
-    print(f"Splitting {base_name} ({duration:.1f}s) into {num_segments} segments...")
+    log(f"Splitting {base_name} ({duration:.1f}s) into {num_segments} segments...")
     
-    # Process each segment with a progress bar
-    for i in tqdm(range(num_segments), desc=f"Splitting {base_name}", unit="segment"):
-        start_time = i * segment_length
-        
-        # Create output filename
-        output_filename = f"{base_name}_part{i+1:03d}.{output_format}"
-        output_path = os.path.join(output_dir, output_filename)
-        
-        # ffmpeg command to extract the segment
+    # One ffmpeg segmenter pass walks the input once and writes every part,
+    # instead of re-opening and seeking the input once per segment.
+    # Literal '%' in the name must be escaped for the segment muxer's pattern.
+    output_pattern = os.path.join(
+        output_dir, f"{base_name.replace('%', '%%')}_part%03d.{output_format}"
+    )
+    cmd = [
+        "ffmpeg",
+        "-hide_banner",
+        "-loglevel", "error",
+        "-progress", "pipe:1",  # key=value progress blocks on stdout
+        "-nostats",
+        "-i", file_path,
+        "-c", "copy",  # Copy codec without re-encoding for speed
+        "-map", "0",
+        "-f", "segment",
+        "-segment_time", str(segment_length),
+        "-segment_start_number", "1",  # Keep the 1-based _part001 naming
+        "-reset_timestamps", "1",
+        "-y",  # Overwrite output files without asking
+        output_pattern
+    ]
+    
+    # Run ffmpeg. stderr goes to a temp file so a chatty error can't fill a
+    # pipe nobody is reading while we consume the progress stream.
+    with tempfile.TemporaryFile(mode="w+") as errors:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=errors, text=True)
+        try:
+            with tqdm(total=round(duration, 1), unit="s", desc=base_name, leave=False,
+                      disable=not (progress and sys.stderr.isatty())) as bar:
+                for line in proc.stdout:
+                    key, _, value = line.strip().partition("=")
+                    # Despite the name, out_time_ms is in microseconds.
+                    if key != "out_time_ms" or not value.lstrip("-").isdigit():
+                        continue
+                    position = min(int(value) / 1_000_000, duration)
+                    bar.update(max(0.0, round(position - bar.n, 1)))
+            returncode = proc.wait()
+        except BaseException:
+            proc.terminate()
+            proc.wait()
+            raise
+        if returncode != 0:
+            errors.seek(0)
+            log(f"❌ Error splitting {base_name}: {errors.read().strip()}")
+            return 0
+    
+    log(f"✅ {base_name} split into {num_segments} parts in {output_dir}")
+    return num_segments
+
+def concat_segments(parts, output_path):
+    """Join `parts` back into `output_path` with one ffmpeg stream-copy pass.
+
+    Uses the concat demuxer, so N parts cost one process launch rather than
+    N-1 pairwise merges. Parts must share codec parameters, which holds for
+    the output of split_audio_file. Returns True on success.
+    """
+    # Concat list entries are single-quoted; a literal ' is written as '\''.
+    lines = [
+        "file '%s'" % os.path.abspath(part).replace("'", "'\\''")
+        for part in parts
+    ]
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", encoding="utf-8",
+                                     delete=False) as list_file:
+        list_file.write("\n".join(lines) + "\n")
+    try:
         cmd = [
             "ffmpeg",
-            "-i", file_path,
-            "-ss", str(start_time),
-            "-t", str(segment_length),
-            "-c", "copy",  # Copy codec without re-encoding for speed
-            "-y",  # Overwrite output files without asking
+            "-hide_banner",
+            "-loglevel", "error",
+            "-f", "concat",
+            "-safe", "0",  # Allow absolute paths in the list
+            "-i", list_file.name,
+            "-c", "copy",
+            "-y",
             output_path
         ]
-        
-        # Run ffmpeg
-        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-    
-    print(f"✅ {base_name} split into {num_segments} parts in {output_dir}")
-    return num_segments
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    finally:
+        os.unlink(list_file.name)
+    if result.returncode != 0:
+        print(f"❌ Error joining {len(parts)} parts into {output_path}: {result.stderr.strip()}")
+        return False
+    return True
 
 def main():
     parser = argparse.ArgumentParser(description="Split audio files into smaller segments")
@@ -106,6 +196,13 @@ def main():
         default="m4a",
         help="Output format (default: m4a)"
     )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of files to split in parallel (default: CPU count). "
+             "Use 1 on spinning disks to avoid seek thrashing."
+    )
     args = parser.parse_args()
     
     # Ensure the input folder exists
@@ -128,7 +225,7 @@ def main():
         #import pdb; pdb.set_trace()  # Breakpoint for debugging
         
         if os.path.isfile(file_path):
-            if file_path.lower().endswith((".m4a", ".opus")):
+            if AUDIO_NAME_RE.search(file_path):
                 audio_files.append(file_path)
             else:
                 print(f"Error: File '{file_path}' is not a supported audio format (.m4a or .opus).")
@@ -138,9 +235,10 @@ def main():
             return
     else:
         # Process all files in the directory
-        for filename in os.listdir(args.input_folder):
-            if filename.lower().endswith((".m4a", ".opus")):
-                audio_files.append(os.path.join(args.input_folder, filename))
+        with os.scandir(args.input_folder) as entries:
+            for entry in entries:
+                if AUDIO_NAME_RE.search(entry.name) and entry.is_file():
+                    audio_files.append(entry.path)
     
     if not audio_files:
         print(f"No .m4a or .opus files found in {args.input_folder}")
@@ -155,14 +253,24 @@ def main():
     total_segments = 0
     start_time = time.time()
     
-    for file_path in audio_files:
-        segments = split_audio_file(
-            file_path, 
-            args.output, 
-            args.segment_length, 
-            args.format
-        )
-        total_segments += segments
+    # Each ffmpeg -c copy job is independent I/O, so fan files out across
+    # processes. Capped by file count so small batches don't start idle workers.
+    max_workers = max(1, min(len(audio_files), args.jobs))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                split_audio_file,
+                file_path,
+                args.output,
+                args.segment_length,
+                args.format,
+                # Bars from parallel workers would overwrite each other.
+                progress=max_workers == 1,
+            ): file_path
+            for file_path in audio_files
+        }
+        for future in as_completed(futures):
+            total_segments += future.result()
     
     # Print summary
     elapsed = time.time() - start_time
@@ -100,6 +100,15 @@ FASTER_REPOS = {
     "large-v3": "Systran/faster-whisper-large-v3",
 }
 
+OPENVINO_REPOS = {
+    "tiny":     "OpenVINO/whisper-tiny-fp16-ov",
+    "base":     "OpenVINO/whisper-base-fp16-ov",
+    "small":    "OpenVINO/whisper-small-fp16-ov",
+    "medium":   "OpenVINO/whisper-medium-fp16-ov",
+    "large":    "OpenVINO/whisper-large-v3-fp16-ov",
+    "large-v3": "OpenVINO/whisper-large-v3-fp16-ov",
+}
+
 OPENAI_NAMES = {
     "tiny":     "tiny",
     "base":     "base",
@@ -122,6 +131,12 @@ def fetch_faster(size):
     snapshot_download(repo_id=repo)
 
 
+def fetch_openvino(size):
+    repo = OPENVINO_REPOS[size]
+    print(f"  → openvino: {repo}")
+    snapshot_download(repo_id=repo)
+
+
 def fetch_openai(size):
     name = OPENAI_NAMES[size]
     print(f"  → openai-whisper: {name} (loading triggers download)")
@@ -140,6 +155,7 @@ FETCHERS = {
     "mlx-whisper":    fetch_mlx,
     "faster-whisper": fetch_faster,
     "openai-whisper": fetch_openai,
+    "openvino":       fetch_openvino,
 }
 
 targets = []
@@ -0,0 +1,156 @@
+"""Tests for audio_splitter.py.
+
+ffmpeg/ffprobe are mocked — these cover command construction and
+bookkeeping, not actual media processing.
+"""
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch, MagicMock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import audio_splitter  # noqa: E402
+
+
+class TestAudioNameFilter(unittest.TestCase):
+    def test_matches_supported_suffixes_case_insensitively(self):
+        for name in ("a.m4a", "b.OPUS", "c.M4a"):
+            self.assertTrue(audio_splitter.AUDIO_NAME_RE.search(name), name)
+        for name in ("a.mp3", "m4a", "a.m4a.txt", "a.opus.bak"):
+            self.assertFalse(audio_splitter.AUDIO_NAME_RE.search(name), name)
+
+
+class TestGetDuration(unittest.TestCase):
+    def test_prefers_mutagen_header_read(self):
+        fake_mutagen = MagicMock()
+        fake_mutagen.File.return_value.info.length = 42.5
+        with patch.dict(sys.modules, {"mutagen": fake_mutagen}), \
+                patch("audio_splitter.subprocess.run") as mock_run:
+            self.assertEqual(audio_splitter.get_duration("/in/a.m4a"), 42.5)
+        mock_run.assert_not_called()
+
+    def test_falls_back_to_ffprobe_when_mutagen_missing(self):
+        with patch.dict(sys.modules, {"mutagen": None}), \
+                patch("audio_splitter.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(stdout="12.25\n")
+            self.assertEqual(audio_splitter.get_duration("/in/a.m4a"), 12.25)
+        self.assertEqual(mock_run.call_args.args[0][0], "ffprobe")
+
+    def test_falls_back_to_ffprobe_for_unknown_container(self):
+        fake_mutagen = MagicMock()
+        fake_mutagen.File.return_value = None
+        with patch.dict(sys.modules, {"mutagen": fake_mutagen}), \
+                patch("audio_splitter.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(stdout="7.0\n")
+            self.assertEqual(audio_splitter.get_duration("/in/a.weird"), 7.0)
+
+
+class TestSplitAudioFile(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.out_dir = os.path.join(self.tmp.name, "split")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _split(self, returncode=0, duration=1500.0, name="/in/meeting.m4a", progress_lines=(),
+               **kwargs):
+        def fake_popen(cmd, stdout=None, stderr=None, text=None):
+            stderr.write("boom")
+            proc = MagicMock()
+            proc.stdout = iter(progress_lines)
+            proc.wait.return_value = returncode
+            return proc
+
+        with patch("audio_splitter.get_duration", return_value=duration), \
+                patch("audio_splitter.subprocess.Popen", side_effect=fake_popen) as mock_popen:
+            count = audio_splitter.split_audio_file(name, self.out_dir, 600, "m4a", **kwargs)
+        return count, mock_popen
+
+    def test_single_ffmpeg_segmenter_invocation(self):
+        # 1500s / 600s → 3 parts, but ffmpeg must only be launched once.
+        count, mock_popen = self._split()
+        self.assertEqual(count, 3)
+        self.assertEqual(mock_popen.call_count, 1)
+        cmd = mock_popen.call_args.args[0]
+        self.assertEqual(cmd[0], "ffmpeg")
+        self.assertIn("segment", cmd)
+        self.assertEqual(cmd[cmd.index("-segment_time") + 1], "600")
+        self.assertEqual(cmd[cmd.index("-c") + 1], "copy")
+        self.assertEqual(cmd[-1], os.path.join(self.out_dir, "meeting_part%03d.m4a"))
+
+    def test_percent_in_name_is_escaped(self):
+        _, mock_popen = self._split(name="/in/100% done.m4a")
+        cmd = mock_popen.call_args.args[0]
+        self.assertEqual(cmd[-1], os.path.join(self.out_dir, "100%% done_part%03d.m4a"))
+
+    def test_ffmpeg_failure_reports_zero_segments(self):
+        count, _ = self._split(returncode=1)
+        self.assertEqual(count, 0)
+
+    def test_messages_go_through_log(self):
+        log = MagicMock()
+        self._split(log=log)
+        messages = [c.args[0] for c in log.call_args_list]
+        self.assertTrue(messages[0].startswith("Splitting meeting"))
+        self.assertIn("split into 3 parts", messages[-1])
+
+    def test_progress_is_streamed_from_ffmpeg(self):
+        _, mock_popen = self._split(progress_lines=[
+            "out_time_ms=N/A\n", "out_time_ms=600000000\n", "progress=continue\n",
+            "out_time_ms=1500000000\n", "progress=end\n",
+        ])
+        cmd = mock_popen.call_args.args[0]
+        self.assertEqual(cmd[cmd.index("-progress") + 1], "pipe:1")
+        self.assertIn("-nostats", cmd)
+
+    def test_interrupt_terminates_ffmpeg(self):
+        proc = MagicMock()
+        proc.stdout.__iter__.side_effect = KeyboardInterrupt
+        with patch("audio_splitter.get_duration", return_value=1500.0), \
+                patch("audio_splitter.subprocess.Popen", return_value=proc):
+            with self.assertRaises(KeyboardInterrupt):
+                audio_splitter.split_audio_file("/in/meeting.m4a", self.out_dir, 600, "m4a")
+        proc.terminate.assert_called_once()
+
+
+class TestConcatSegments(unittest.TestCase):
+    def _concat(self, parts, returncode=0):
+        seen = {}
+
+        def fake_run(cmd, **kwargs):
+            list_path = cmd[cmd.index("-i") + 1]
+            with open(list_path, encoding="utf-8") as f:
+                seen["list"] = f.read()
+            seen["list_path"] = list_path
+            return MagicMock(returncode=returncode, stderr="boom")
+
+        with patch("audio_splitter.subprocess.run", side_effect=fake_run) as mock_run:
+            ok = audio_splitter.concat_segments(parts, "/out/joined.m4a")
+        return ok, mock_run, seen
+
+    def test_single_ffmpeg_call_with_concat_list(self):
+        ok, mock_run, seen = self._concat(["/in/a_part001.m4a", "/in/a_part002.m4a"])
+        self.assertTrue(ok)
+        self.assertEqual(mock_run.call_count, 1)
+        cmd = mock_run.call_args.args[0]
+        self.assertEqual(cmd[cmd.index("-f") + 1], "concat")
+        self.assertEqual(cmd[cmd.index("-c") + 1], "copy")
+        self.assertEqual(cmd[-1], "/out/joined.m4a")
+        self.assertEqual(seen["list"],
+                         "file '/in/a_part001.m4a'\nfile '/in/a_part002.m4a'\n")
+        self.assertFalse(os.path.exists(seen["list_path"]))
+
+    def test_quotes_in_paths_are_escaped(self):
+        _, _, seen = self._concat(["/in/it's_part001.m4a"])
+        self.assertEqual(seen["list"], "file '/in/it'\\''s_part001.m4a'\n")
+
+    def test_failure_returns_false(self):
+        ok, _, _ = self._concat(["/in/a_part001.m4a"], returncode=1)
+        self.assertFalse(ok)
+
+
+if __name__ == "__main__":
+    unittest.main()
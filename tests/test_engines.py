@@ -151,6 +151,173 @@ class TestTranscribeAudioDispatch(unittest.TestCase):
             transcribe.transcribe_audio("faster-whisper", "/tmp/a.m4a", "large", "en")
             m.assert_called_once()
 
+    def test_engine_options_forwarded_as_keywords(self):
+        with patch.object(transcribe, "_transcribe_faster") as m:
+            m.return_value = {"segments": [], "text": ""}
+            transcribe.transcribe_audio("faster-whisper", "/tmp/a.m4a", "large", "en",
+                                        compute_type="int8")
+            m.assert_called_once_with("/tmp/a.m4a", "large", "en", False, compute_type="int8")
+
+    def test_engines_ignore_options_they_do_not_support(self):
+        fake_mlx = MagicMock()
+        fake_mlx.transcribe.return_value = {"segments": [], "text": ""}
+        with patch.dict(sys.modules, {"mlx_whisper": fake_mlx}):
+            transcribe.transcribe_audio("mlx-whisper", "/tmp/a.m4a", "large", "en",
+                                        compute_type="int8")
+        self.assertNotIn("compute_type", fake_mlx.transcribe.call_args.kwargs)
+
+
+class TestChunkedTranscription(unittest.TestCase):
+    """--chunk-seconds: split, transcribe chunks in parallel, stitch in order."""
+
+    def setUp(self):
+        import tempfile
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _fake_split(self, file_path, output_dir, segment_length, output_format, **kwargs):
+        for i in range(3):
+            open(os.path.join(output_dir, f"meeting_part{i + 1:03d}.{output_format}"), "w").close()
+        return 3
+
+    def _fake_engine(self, audio_path, model_name, language, word_timestamps, **options):
+        part = os.path.basename(audio_path)
+        return {"segments": [{"start": 1.0, "end": 2.0, "text": part}], "text": part}
+
+    def test_chunks_are_stitched_in_order_with_offsets(self):
+        from concurrent.futures import ThreadPoolExecutor
+        with patch("transcribe._audio_duration", return_value=1500.0), \
+                patch("audio_splitter.split_audio_file", side_effect=self._fake_split), \
+                patch("transcribe.ProcessPoolExecutor", ThreadPoolExecutor), \
+                patch.object(transcribe, "_transcribe_faster", side_effect=self._fake_engine):
+            result = transcribe.transcribe_audio(
+                "faster-whisper", "/in/meeting.m4a", "large", "he", chunk_seconds=600)
+        self.assertEqual([s["text"] for s in result["segments"]],
+                         ["meeting_part001.m4a", "meeting_part002.m4a", "meeting_part003.m4a"])
+        self.assertEqual([s["start"] for s in result["segments"]], [1.0, 601.0, 1201.0])
+        self.assertEqual(result["text"],
+                         "meeting_part001.m4a meeting_part002.m4a meeting_part003.m4a")
+
+    def _chunk_threads(self, **options):
+        from concurrent.futures import ThreadPoolExecutor
+        with patch("transcribe._audio_duration", return_value=1500.0), \
+                patch("audio_splitter.split_audio_file", side_effect=self._fake_split), \
+                patch("transcribe.ProcessPoolExecutor", ThreadPoolExecutor), \
+                patch.object(transcribe, "_transcribe_faster", side_effect=self._fake_engine) as m:
+            transcribe.transcribe_audio(
+                "faster-whisper", "/in/meeting.m4a", "large", "he",
+                chunk_seconds=600, **options)
+        return {call.kwargs["threads"] for call in m.call_args_list}
+
+    def test_each_chunk_worker_gets_its_own_thread_budget(self):
+        self.assertEqual(self._chunk_threads(threads=None),
+                         {transcribe._CHUNK_THREADS_PER_WORKER})
+
+    def test_explicit_threads_are_kept_per_chunk(self):
+        self.assertEqual(self._chunk_threads(threads=16), {16})
+
+    def test_split_messages_go_through_log_without_a_bar(self):
+        from concurrent.futures import ThreadPoolExecutor
+        log = MagicMock()
+        with patch("transcribe._audio_duration", return_value=1500.0), \
+                patch("audio_splitter.split_audio_file", side_effect=self._fake_split) as split, \
+                patch("transcribe.ProcessPoolExecutor", ThreadPoolExecutor), \
+                patch.object(transcribe, "_transcribe_faster", side_effect=self._fake_engine) as m:
+            transcribe.transcribe_audio(
+                "faster-whisper", "/in/meeting.m4a", "large", "he", chunk_seconds=600, log=log)
+        self.assertIs(split.call_args.kwargs["log"], log)
+        self.assertFalse(split.call_args.kwargs["progress"])
+        # The caller's log stays in this process
+        self.assertNotIn("log", m.call_args.kwargs)
+
+    def test_short_file_is_not_split(self):
+        with patch("transcribe._audio_duration", return_value=700.0), \
+                patch("audio_splitter.split_audio_file") as split, \
+                patch.object(transcribe, "_transcribe_faster", side_effect=self._fake_engine) as m:
+            transcribe.transcribe_audio(
+                "faster-whisper", "/in/meeting.m4a", "large", "he", chunk_seconds=600)
+        split.assert_not_called()
+        m.assert_called_once()
+
+
+class TestConfigureThreads(unittest.TestCase):
+    def test_default_uses_physical_cores_without_overriding_env(self):
+        with patch.dict(os.environ, {"OMP_NUM_THREADS": "3"}, clear=False), \
+                patch("transcribe._physical_cores", return_value=8):
+            os.environ.pop("MKL_NUM_THREADS", None)
+            self.assertEqual(transcribe._configure_threads(), 3)
+            self.assertEqual(os.environ["OMP_NUM_THREADS"], "3")
+            self.assertEqual(os.environ["MKL_NUM_THREADS"], "8")
+
+    def test_explicit_threads_override_env(self):
+        with patch.dict(os.environ, {"OMP_NUM_THREADS": "3"}, clear=False):
+            self.assertEqual(transcribe._configure_threads(2), 2)
+            for var in transcribe._THREAD_ENV_VARS:
+                self.assertEqual(os.environ[var], "2")
+
+    def test_physical_cores_falls_back_without_psutil(self):
+        with patch.dict(sys.modules, {"psutil": None}), \
+                patch("os.cpu_count", return_value=12):
+            self.assertEqual(transcribe._physical_cores(), 12)
+
+
+class TestDecodeOptions(unittest.TestCase):
+    def setUp(self):
+        transcribe._MODEL_CACHE.clear()
+
+    def test_unset_options_keep_engine_defaults(self):
+        self.assertEqual(transcribe._decode_kwargs(), {})
+
+    def test_openai_greedy_omits_beam_size(self):
+        fake_model = MagicMock()
+        fake_model.transcribe.return_value = {"segments": [], "text": ""}
+        fake_whisper = MagicMock()
+        fake_whisper.load_model.return_value = fake_model
+        with patch.dict(sys.modules, {"whisper": fake_whisper}):
+            transcribe._transcribe_openai("/tmp/a.m4a", "medium", "he", False, beam_size=1,
+                                          temperature=0.0, condition_on_previous_text=False)
+        kwargs = fake_model.transcribe.call_args.kwargs
+        self.assertNotIn("beam_size", kwargs)
+        self.assertEqual(kwargs["temperature"], 0.0)
+        self.assertFalse(kwargs["condition_on_previous_text"])
+
+    def test_openai_beam_search_passes_through(self):
+        fake_model = MagicMock()
+        fake_model.transcribe.return_value = {"segments": [], "text": ""}
+        fake_whisper = MagicMock()
+        fake_whisper.load_model.return_value = fake_model
+        with patch.dict(sys.modules, {"whisper": fake_whisper}):
+            transcribe._transcribe_openai("/tmp/a.m4a", "medium", "he", False, beam_size=5,
+                                          temperature=transcribe._QUALITY_TEMPERATURES)
+        kwargs = fake_model.transcribe.call_args.kwargs
+        self.assertEqual(kwargs["beam_size"], 5)
+        self.assertEqual(kwargs["temperature"], transcribe._QUALITY_TEMPERATURES)
+
+    def test_mlx_never_gets_beam_size(self):
+        fake_mlx = MagicMock()
+        fake_mlx.transcribe.return_value = {"segments": [], "text": ""}
+        with patch.dict(sys.modules, {"mlx_whisper": fake_mlx}):
+            transcribe._transcribe_mlx("/tmp/a.m4a", "large", "he", False,
+                                       beam_size=5, temperature=0.0)
+        kwargs = fake_mlx.transcribe.call_args.kwargs
+        self.assertNotIn("beam_size", kwargs)
+        self.assertEqual(kwargs["temperature"], 0.0)
+
+    def test_faster_gets_beam_size_and_temperature(self):
+        fake_model = MagicMock()
+        fake_model.transcribe.return_value = (iter([]), SimpleNamespace(language="he"))
+        fake_module = MagicMock()
+        fake_module.WhisperModel.return_value = fake_model
+        with patch.dict(sys.modules, {"faster_whisper": fake_module}):
+            transcribe._transcribe_faster("/tmp/a.m4a", "large", "he", False,
+                                          beam_size=1, temperature=0.0)
+        kwargs = fake_model.transcribe.call_args.kwargs
+        self.assertEqual(kwargs["beam_size"], 1)
+        self.assertEqual(kwargs["temperature"], 0.0)
+        self.assertNotIn("condition_on_previous_text", kwargs)
+
 
 class TestOpenAIAdapter(unittest.TestCase):
     def setUp(self):
@@ -190,6 +357,31 @@ class TestOpenAIAdapter(unittest.TestCase):
         # load_model should be called once due to module-level cache
         self.assertEqual(fake_whisper.load_model.call_count, 1)
 
+    def _run_with_torch(self, cuda_available, **kwargs):
+        fake_model = MagicMock()
+        fake_model.transcribe.return_value = {"segments": [], "text": ""}
+        fake_whisper = MagicMock()
+        fake_whisper.load_model.return_value = fake_model
+        fake_torch = MagicMock()
+        fake_torch.cuda.is_available.return_value = cuda_available
+        with patch.dict(sys.modules, {"whisper": fake_whisper, "torch": fake_torch}):
+            transcribe._transcribe_openai("/tmp/a.m4a", "medium", "he", False, **kwargs)
+        return fake_whisper, fake_model
+
+    def test_auto_device_uses_cuda_with_fp16_when_available(self):
+        fake_whisper, fake_model = self._run_with_torch(True, device="auto")
+        fake_whisper.load_model.assert_called_once_with("medium", device="cuda")
+        self.assertTrue(fake_model.transcribe.call_args.kwargs["fp16"])
+
+    def test_auto_device_falls_back_to_cpu_fp32(self):
+        fake_whisper, fake_model = self._run_with_torch(False)
+        fake_whisper.load_model.assert_called_once_with("medium", device="cpu")
+        self.assertFalse(fake_model.transcribe.call_args.kwargs["fp16"])
+
+    def test_explicit_device_wins_over_auto_detection(self):
+        fake_whisper, _ = self._run_with_torch(True, device="cpu")
+        fake_whisper.load_model.assert_called_once_with("medium", device="cpu")
+
 
 class TestMLXAdapter(unittest.TestCase):
     def test_size_maps_to_hf_repo(self):
@@ -237,6 +429,65 @@ class TestMLXAdapter(unittest.TestCase):
         self.assertIn("mlx-whisper", str(ctx.exception))
 
 
+class TestOpenVINOAdapter(unittest.TestCase):
+    def setUp(self):
+        import tempfile
+        transcribe._MODEL_CACHE.clear()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.fake_ov = MagicMock()
+        self.fake_pipe = self.fake_ov.WhisperPipeline.return_value
+        self.fake_pipe.generate.return_value = SimpleNamespace(
+            texts=[" hello world"],
+            chunks=[SimpleNamespace(start_ts=0.0, end_ts=1.0, text=" hello"),
+                    SimpleNamespace(start_ts=1.0, end_ts=2.0, text=" world")],
+        )
+        self.fake_hub = MagicMock()
+        self.fake_hub.snapshot_download.side_effect = lambda repo_id: f"/models/{repo_id}"
+        self.patches = [
+            patch.dict(sys.modules, {"openvino_genai": self.fake_ov,
+                                     "huggingface_hub": self.fake_hub}),
+            patch("transcribe._OPENVINO_CACHE_ROOT", self.tmp.name),
+            patch("transcribe._load_audio_16k", return_value=[0.0] * 16000),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in reversed(self.patches):
+            p.stop()
+        self.tmp.cleanup()
+
+    def test_returns_normalized_shape(self):
+        result = transcribe.transcribe_audio("openvino", "/tmp/a.m4a", "large", "he")
+        self.assertEqual(result["segments"][1], {"start": 1.0, "end": 2.0, "text": " world"})
+        self.assertEqual(result["text"], "hello world")
+        kwargs = self.fake_pipe.generate.call_args.kwargs
+        self.assertEqual(kwargs["language"], "<|he|>")
+        self.assertTrue(kwargs["return_timestamps"])
+
+    def test_compiled_kernels_cached_per_model_and_device(self):
+        transcribe._transcribe_openvino("/tmp/a.m4a", "small", "he", False, device="gpu")
+        args, kwargs = self.fake_ov.WhisperPipeline.call_args
+        self.assertEqual(args, ("/models/OpenVINO/whisper-small-fp16-ov", "GPU"))
+        self.assertEqual(kwargs["CACHE_DIR"],
+                         os.path.join(self.tmp.name, "whisper-small-fp16-ov-gpu"))
+        self.assertTrue(os.path.isdir(kwargs["CACHE_DIR"]))
+
+    def test_pipeline_is_reused_within_process(self):
+        transcribe._transcribe_openvino("/tmp/a.m4a", "small", "he", False)
+        transcribe._transcribe_openvino("/tmp/b.m4a", "small", "he", False)
+        self.assertEqual(self.fake_ov.WhisperPipeline.call_count, 1)
+        self.assertEqual(self.fake_ov.WhisperPipeline.call_args.args[1], "AUTO")
+
+    def test_torch_only_device_rejected(self):
+        with self.assertRaisesRegex(ValueError, "openvino"):
+            transcribe._transcribe_openvino("/tmp/a.m4a", "small", "he", False, device="cuda")
+
+    def test_openvino_devices_rejected_by_other_engines(self):
+        with self.assertRaisesRegex(ValueError, "only available with --engine openvino"):
+            transcribe._resolve_torch_device("npu")
+
+
 class TestHasSpeech(unittest.TestCase):
     def test_low_no_speech_prob_is_speech(self):
         self.assertTrue(transcribe._has_speech([{"no_speech_prob": 0.1}]))
@@ -407,6 +658,74 @@ class TestFasterWhisperAdapter(unittest.TestCase):
         kwargs = fake_module.WhisperModel.call_args.kwargs
         self.assertEqual(kwargs.get("compute_type"), "auto")
 
+    def test_explicit_compute_type_passes_through(self):
+        fake_module, _ = self._make_fake_module([])
+        with patch.dict(sys.modules, {"faster_whisper": fake_module}):
+            transcribe._transcribe_faster("/tmp/a.m4a", "large", "he", False, compute_type="int8")
+        kwargs = fake_module.WhisperModel.call_args.kwargs
+        self.assertEqual(kwargs.get("compute_type"), "int8")
+
+    def test_cache_is_keyed_by_compute_type(self):
+        fake_module, fake_model = self._make_fake_module([])
+        fake_model.transcribe.side_effect = lambda *a, **k: (iter([]), SimpleNamespace(language="he"))
+        with patch.dict(sys.modules, {"faster_whisper": fake_module}):
+            transcribe._transcribe_faster("/tmp/a.m4a", "large", "he", False, compute_type="int8")
+            transcribe._transcribe_faster("/tmp/a.m4a", "large", "he", False, compute_type="float32")
+            transcribe._transcribe_faster("/tmp/a.m4a", "large", "he", False, compute_type="int8")
+        self.assertEqual(fake_module.WhisperModel.call_count, 2)
+
+    def test_device_defaults_to_auto_and_passes_through(self):
+        fake_module, _ = self._make_fake_module([])
+        with patch.dict(sys.modules, {"faster_whisper": fake_module}):
+            transcribe._transcribe_faster("/tmp/a.m4a", "large", "he", False)
+            self.assertEqual(fake_module.WhisperModel.call_args.kwargs["device"], "auto")
+            transcribe._transcribe_faster("/tmp/a.m4a", "large", "he", False, device="cuda")
+            self.assertEqual(fake_module.WhisperModel.call_args.kwargs["device"], "cuda")
+        self.assertEqual(fake_module.WhisperModel.call_count, 2)
+
+    def test_threads_map_to_cpu_threads(self):
+        fake_module, _ = self._make_fake_module([])
+        with patch.dict(sys.modules, {"faster_whisper": fake_module}):
+            transcribe._transcribe_faster("/tmp/a.m4a", "large", "he", False)
+            self.assertEqual(fake_module.WhisperModel.call_args.kwargs["cpu_threads"], 0)
+            transcribe._transcribe_faster("/tmp/a.m4a", "large", "he", False, threads=6)
+            self.assertEqual(fake_module.WhisperModel.call_args.kwargs["cpu_threads"], 6)
+
+    def test_mps_is_rejected(self):
+        fake_module, _ = self._make_fake_module([])
+        with patch.dict(sys.modules, {"faster_whisper": fake_module}):
+            with self.assertRaisesRegex(ValueError, "MPS"):
+                transcribe._transcribe_faster("/tmp/a.m4a", "large", "he", False, device="mps")
+
+    def _run_batched(self, duration, batch_size=16):
+        fake_module, fake_model = self._make_fake_module([])
+        fake_pipeline = MagicMock()
+        fake_pipeline.transcribe.return_value = (iter([]), SimpleNamespace(language="he"))
+        fake_module.BatchedInferencePipeline.return_value = fake_pipeline
+        with patch.dict(sys.modules, {"faster_whisper": fake_module}), \
+                patch("transcribe._audio_duration", return_value=duration):
+            transcribe._transcribe_faster("/tmp/a.m4a", "large", "he", False, batch_size=batch_size)
+        return fake_model, fake_pipeline
+
+    def test_long_audio_uses_batched_pipeline(self):
+        fake_model, fake_pipeline = self._run_batched(duration=600.0)
+        fake_model.transcribe.assert_not_called()
+        self.assertEqual(fake_pipeline.transcribe.call_args.kwargs["batch_size"], 16)
+
+    def test_short_audio_stays_sequential(self):
+        fake_model, fake_pipeline = self._run_batched(duration=30.0)
+        fake_pipeline.transcribe.assert_not_called()
+        self.assertNotIn("batch_size", fake_model.transcribe.call_args.kwargs)
+
+    def test_unknown_duration_stays_sequential(self):
+        fake_model, fake_pipeline = self._run_batched(duration=None)
+        fake_pipeline.transcribe.assert_not_called()
+        fake_model.transcribe.assert_called_once()
+
+    def test_batching_off_by_default(self):
+        fake_model, fake_pipeline = self._run_batched(duration=600.0, batch_size=None)
+        fake_pipeline.transcribe.assert_not_called()
+
     def test_word_timestamps_pass_through(self):
         words = [SimpleNamespace(start=0.0, end=0.5, word="hi")]
         segs = [SimpleNamespace(start=0.0, end=0.5, text="hi", words=words)]
@@ -426,6 +745,16 @@ class TestFasterWhisperAdapter(unittest.TestCase):
         args, _ = fake_module.WhisperModel.call_args
         self.assertEqual(args[0], "large-v3")
 
+    def test_detection_and_transcription_share_cached_model(self):
+        # Language gate + full transcription in one process must not pay
+        # for a second model load.
+        fake_module, fake_model = self._make_fake_module([])
+        fake_model.transcribe.side_effect = lambda *a, **k: (iter([]), SimpleNamespace(language="he"))
+        with patch.dict(sys.modules, {"faster_whisper": fake_module}):
+            transcribe._detect_clip("faster-whisper", "/tmp/clip.wav", "medium")
+            transcribe._transcribe_faster("/tmp/a.m4a", "medium", "he", False)
+        self.assertEqual(fake_module.WhisperModel.call_count, 1)
+
     def test_missing_package_gives_actionable_error(self):
         with patch.dict(sys.modules, {"faster_whisper": None}):
             with self.assertRaises(RuntimeError) as ctx:
@@ -433,6 +762,165 @@ class TestFasterWhisperAdapter(unittest.TestCase):
         self.assertIn("faster-whisper", str(ctx.exception))
 
 
+class TestTranscribeToFile(unittest.TestCase):
+    """Plain transcripts are written segment by segment via a .part file."""
+
+    def setUp(self):
+        import tempfile
+        self.tmp = tempfile.TemporaryDirectory()
+        self.txt_path = os.path.join(self.tmp.name, "a.txt")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _read(self):
+        with open(self.txt_path, encoding="utf-8") as f:
+            return f.read()
+
+    def test_streaming_engine_writes_each_segment_as_decoded(self):
+        seen_on_disk = []
+
+        def fake_transcribe(engine, audio_path, model_name, language, on_segment=None, **opts):
+            for text in (" hello", " world"):
+                on_segment({"start": 0.0, "end": 1.0, "text": text})
+                seen_on_disk.append(os.path.exists(self.txt_path + ".part"))
+            return {"segments": [], "text": ""}
+
+        echoed = []
+        with patch("transcribe.transcribe_audio", side_effect=fake_transcribe):
+            transcribe._transcribe_to_file("faster-whisper", "/in/a.m4a", "large", "he",
+                                           self.txt_path, echo=echoed.append)
+        self.assertEqual(self._read(), "hello\nworld")
+        self.assertEqual(seen_on_disk, [True, True])
+        self.assertFalse(os.path.exists(self.txt_path + ".part"))
+        self.assertEqual(echoed[1:3], ["hello", "world"])
+
+    def test_non_streaming_engine_written_from_result(self):
+        result = {"segments": [{"text": " one"}, {"text": "two "}], "text": "one two"}
+        with patch("transcribe.transcribe_audio", return_value=result):
+            transcribe._transcribe_to_file("openai-whisper", "/in/a.m4a", "large", "he",
+                                           self.txt_path)
+        self.assertEqual(self._read(), "one\ntwo")
+
+    def test_failure_leaves_no_partial_transcript(self):
+        with patch("transcribe.transcribe_audio", side_effect=RuntimeError("boom")):
+            with self.assertRaises(RuntimeError):
+                transcribe._transcribe_to_file("openai-whisper", "/in/a.m4a", "large", "he",
+                                               self.txt_path)
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+    def test_faster_adapter_reports_segments_as_decoded(self):
+        segs = [SimpleNamespace(start=0.0, end=1.0, text=" hi", words=None)]
+        fake_model = MagicMock()
+        fake_model.transcribe.return_value = (iter(segs), SimpleNamespace(language="he"))
+        fake_module = MagicMock()
+        fake_module.WhisperModel.return_value = fake_model
+        transcribe._MODEL_CACHE.clear()
+        got = []
+        with patch.dict(sys.modules, {"faster_whisper": fake_module}):
+            transcribe._transcribe_faster("/tmp/a.m4a", "large", "he", False, on_segment=got.append)
+        self.assertEqual(got, [{"start": 0.0, "end": 1.0, "text": " hi"}])
+
+
+class TestTranscribeOne(unittest.TestCase):
+    """The shared per-file driver behind transcribe_single_file / transcribe_folder."""
+
+    def setUp(self):
+        import tempfile
+        self.tmp = tempfile.TemporaryDirectory()
+        self.audio = os.path.join(self.tmp.name, "a.m4a")
+        self.txt_path = os.path.join(self.tmp.name, "a.txt")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_cache_hit_skips_engine(self):
+        with patch("transcribe._transcript_cache_key", return_value="k"), \
+                patch("transcribe._cache_lookup", return_value="cached"), \
+                patch("transcribe.transcribe_audio") as engine:
+            path, elapsed = transcribe._transcribe_one(
+                self.audio, self.txt_path, "large", "he", False, "faster-whisper", log=lambda m: None)
+        engine.assert_not_called()
+        self.assertEqual((path, elapsed), (self.txt_path, 0))
+        with open(self.txt_path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "cached")
+
+    def test_diarized_path_labels_segments_and_stores_cache(self):
+        segments = [{"start": 0.0, "end": 1.0, "text": "hi"}]
+        with patch("transcribe._transcript_cache_key", return_value="k"), \
+                patch("transcribe._cache_lookup", return_value=None), \
+                patch("transcribe._cache_store") as store, \
+                patch("transcribe.transcribe_audio", return_value={"segments": segments}) as engine, \
+                patch("transcribe._diarize_segments", return_value="Speaker 1: hi") as diarize:
+            transcribe._transcribe_one(
+                self.audio, self.txt_path, "large", "en", False, "faster-whisper",
+                diarization_pipeline=MagicMock(), log=lambda m: None)
+        self.assertTrue(engine.call_args.kwargs["word_timestamps"])
+        self.assertEqual(diarize.call_args.args[1], segments)
+        store.assert_called_once_with("k", "Speaker 1: hi")
+        with open(self.txt_path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "Speaker 1: hi")
+
+
+class TestTranscriptCache(unittest.TestCase):
+    def setUp(self):
+        import tempfile
+        self.tmp = tempfile.TemporaryDirectory()
+        self.audio = os.path.join(self.tmp.name, "a.m4a")
+        with open(self.audio, "wb") as f:
+            f.write(b"audio-bytes")
+        patcher = patch.object(transcribe, "_TRANSCRIPT_CACHE_PATH",
+                               os.path.join(self.tmp.name, "cache", "index.sqlite"))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _key(self, **overrides):
+        params = dict(engine="faster-whisper", model_name="large", language="he",
+                      mode="plain", engine_options={"compute_type": "auto"})
+        params.update(overrides)
+        return transcribe._transcript_cache_key(self.audio, **params)
+
+    def test_roundtrip(self):
+        key = self._key()
+        self.assertIsNone(transcribe._cache_lookup(key))
+        transcribe._cache_store(key, "שלום\nworld")
+        self.assertEqual(transcribe._cache_lookup(key), "שלום\nworld")
+
+    def test_key_ignores_path_but_tracks_content(self):
+        renamed = os.path.join(self.tmp.name, "renamed.m4a")
+        with open(renamed, "wb") as f:
+            f.write(b"audio-bytes")
+        key = self._key()
+        self.assertEqual(key, transcribe._transcript_cache_key(
+            renamed, "faster-whisper", "large", "he", "plain", {"compute_type": "auto"}))
+        with open(self.audio, "ab") as f:
+            f.write(b"more")
+        self.assertNotEqual(key, self._key())
+
+    def test_key_tracks_settings(self):
+        base = self._key()
+        self.assertNotEqual(base, self._key(model_name="medium"))
+        self.assertNotEqual(base, self._key(language="en"))
+        self.assertNotEqual(base, self._key(mode="diarized"))
+        self.assertNotEqual(base, self._key(engine_options={"compute_type": "int8"}))
+
+    def test_key_ignores_thread_count(self):
+        self.assertEqual(self._key(engine_options={"compute_type": "auto"}),
+                         self._key(engine_options={"compute_type": "auto", "threads": 8}))
+
+    def test_unusable_cache_is_a_miss(self):
+        # A cache path that can't be created must not break transcription.
+        blocker = os.path.join(self.tmp.name, "blocker")
+        open(blocker, "w").close()
+        with patch.object(transcribe, "_TRANSCRIPT_CACHE_PATH",
+                          os.path.join(blocker, "index.sqlite")):
+            transcribe._cache_store("k", "text")
+            self.assertIsNone(transcribe._cache_lookup("k"))
+
+
 class TestLoadDiarizationPipelineTokenHandling(unittest.TestCase):
     """Regression test: empty HF_TOKEN env must not be passed verbatim to pyannote.
 
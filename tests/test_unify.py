@@ -0,0 +1,78 @@
+"""Tests for unify_transcripts in transcribe.py.
+
+Runs against a temp folder of small transcript files — no models involved.
+"""
+import glob
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import transcribe  # noqa: E402
+
+
+class TestUnifyTranscripts(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.folder = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write(self, name, content=""):
+        with open(os.path.join(self.folder, name), "w", encoding="utf-8") as f:
+            f.write(content)
+
+    def _unify(self, order="asc"):
+        pattern = os.path.join(self.folder, "unified_transcript_*.txt")
+        before = set(glob.glob(pattern))
+        with patch("builtins.print"):
+            transcribe.unify_transcripts(self.folder, order)
+        outputs = sorted(set(glob.glob(pattern)) - before)
+        self.assertEqual(len(outputs), 1)
+        with open(outputs[0], encoding="utf-8") as f:
+            return f.read()
+
+    def test_collects_only_transcripts(self):
+        self._write("b.txt", "second")
+        self._write("a.TXT", "first")
+        self._write("a.m4a")
+        self._write("notes.md", "ignored")
+        self._write("unified_transcript_asc_20260101_000000.txt", "old unified")
+        os.mkdir(os.path.join(self.folder, "dir.txt"))
+        body = self._unify()
+        self.assertNotIn("ignored", body)
+        self.assertNotIn("old unified", body)
+        self.assertIn("PART 1/2: a.m4a\n", body)
+        self.assertIn("PART 2/2: Unknown\n", body)
+        self.assertLess(body.index("first"), body.index("second"))
+
+    def test_descending_order(self):
+        self._write("a.txt", "first")
+        self._write("b.txt", "second")
+        body = self._unify("desc")
+        self.assertLess(body.index("second"), body.index("first"))
+
+    def test_output_format(self):
+        self._write("a.txt", "hello")
+        body = self._unify()
+        rule = "=" * 60
+        self.assertEqual(body, f"\n\n{rule}\nPART 1/1: Unknown\n{rule}\n\nhello\n\n")
+
+
+    def test_transcription_time_shown_for_fresh_transcripts(self):
+        path = os.path.join(self.folder, "out.txt")
+        transcribe._write_unified_transcript(
+            path, ["a.m4a", "b.m4a"], ["new", "שלום"], [12.34, 0])
+        with open(path, encoding="utf-8") as f:
+            body = f.read()
+        self.assertIn("PART 1/2: a.m4a (Transcribed in 12.3 seconds)\n", body)
+        self.assertIn("PART 2/2: b.m4a\n", body)
+        self.assertTrue(body.endswith("שלום\n\n"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,649 @@
+"""Tests for video_converter.py.
+
+ffmpeg/ffprobe are mocked — these cover command construction and
+bookkeeping, not actual media processing.
+"""
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch, MagicMock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import video_converter  # noqa: E402
+from video_converter import Result  # noqa: E402
+
+CONVERTED, SKIPPED, FAILED = Result.CONVERTED, Result.SKIPPED, Result.FAILED
+# Uncached probe, kept before setUpModule pins encoder selection
+probe_encoders = video_converter.available_encoders.__wrapped__
+
+
+def setUpModule():
+    # Commands are asserted by tool name; keep them bare even where
+    # ffmpeg is installed.
+    video_converter._binaries.update(ffmpeg="ffmpeg", ffprobe="ffprobe")
+    # Pin encoder selection to the defaults (native aac, libmp3lame)
+    patcher = patch("video_converter.available_encoders", return_value=frozenset())
+    patcher.start()
+    unittest.addModuleCleanup(patcher.stop)
+
+
+def fake_popen(returncode=0, hang=False):
+    """Popen stand-in for ffmpeg: writes the output on success, "boom" to
+    stderr on failure, and with `hang` blocks until killed."""
+    def popen(cmd, stdout=None, stderr=None, **kwargs):
+        proc = MagicMock()
+        killed = threading.Event()
+        proc.kill.side_effect = killed.set
+        proc.terminate.side_effect = killed.set
+
+        def lines():
+            yield "out_time_ms=1000000\n"
+            if hang:
+                killed.wait(5)
+
+        def wait():
+            if hang:
+                return -9
+            if returncode == 0:
+                open(cmd[-1], "wb").close()
+            else:
+                stderr.write("".join(f"detail {n}\n" for n in range(100)) + "boom\n")
+            return returncode
+
+        proc.stdout = lines()
+        proc.wait.side_effect = wait
+        return proc
+    return popen
+
+
+class TestConvertVideoToAudio(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.out_dir = self.tmp.name
+        video_converter._probe_cache.clear()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _convert(self, returncode=0, source_codec="h264_only", output_format="m4a",
+                 hang=False, **kwargs):
+        probe = MagicMock(returncode=0, stdout=f"codec_name={source_codec}\nduration=12.5\n")
+        log = []
+        with patch("video_converter.subprocess.run", return_value=probe) as mock_run, \
+                patch("video_converter.subprocess.Popen",
+                      side_effect=fake_popen(returncode, hang)) as mock_popen:
+            ok = video_converter.convert_video_to_audio(
+                "/in/meeting.mp4", self.out_dir, output_format, "192k", log=log.append, **kwargs)
+        self.printed = " ".join(log)
+        self.probes = mock_run.call_count
+        return ok, mock_popen
+
+    def _ffmpeg_cmd(self, mock_popen):
+        return mock_popen.call_args.args[0]
+
+    def test_builds_ffmpeg_command(self):
+        ok, mock_run = self._convert()
+        self.assertEqual(ok, CONVERTED)
+        cmd = self._ffmpeg_cmd(mock_run)
+        self.assertEqual(cmd[0], "ffmpeg")
+        self.assertEqual(cmd[cmd.index("-i") + 1], "/in/meeting.mp4")
+        self.assertEqual(cmd[cmd.index("-acodec") + 1], "aac")
+        self.assertEqual(cmd[cmd.index("-b:a") + 1], "192k")
+        self.assertEqual(cmd[-1], os.path.join(self.out_dir, "meeting.m4a"))
+        self.assertNotIn("-threads", cmd)
+
+    def test_existing_output_is_skipped_without_directory_work(self):
+        open(os.path.join(self.out_dir, "meeting.m4a"), "w").close()
+        with patch("video_converter.os.makedirs") as makedirs:
+            ok, mock_popen = self._convert()
+        self.assertEqual(ok, SKIPPED)
+        makedirs.assert_not_called()
+        mock_popen.assert_not_called()
+
+    def test_prebuilt_command_parts_are_used(self):
+        parts = (("/opt/ffmpeg", "-nostats"), ("-y",))
+        with patch("video_converter._command_parts") as build:
+            _, mock_popen = self._convert(command_parts=parts)
+        build.assert_not_called()
+        cmd = self._ffmpeg_cmd(mock_popen)
+        self.assertEqual(cmd[:3], ["/opt/ffmpeg", "-nostats", "-i"])
+        self.assertEqual(cmd[-2], "-y")
+
+    def test_stream_copy_resolves_no_encoder(self):
+        with patch("video_converter.audio_codec") as codec:
+            self._convert(source_codec="aac")
+        codec.assert_not_called()
+
+    def test_thread_cap_passed_to_ffmpeg(self):
+        _, mock_run = self._convert(threads=3)
+        cmd = self._ffmpeg_cmd(mock_run)
+        self.assertEqual(cmd[cmd.index("-threads") + 1], "3")
+
+    def test_compatible_source_is_stream_copied(self):
+        _, mock_run = self._convert(source_codec="aac")
+        cmd = self._ffmpeg_cmd(mock_run)
+        self.assertEqual(cmd[cmd.index("-c:a") + 1], "copy")
+        self.assertEqual(cmd[cmd.index("-map") + 1], "0:a:0")
+        self.assertNotIn("-b:a", cmd)
+        self.assertNotIn("-acodec", cmd)
+
+    def test_incompatible_source_is_reencoded(self):
+        _, mock_run = self._convert(source_codec="aac", output_format="opus")
+        cmd = self._ffmpeg_cmd(mock_run)
+        self.assertEqual(cmd[cmd.index("-acodec") + 1], "libopus")
+
+    def test_pcm_s16le_source_is_copied_into_wav(self):
+        _, mock_popen = self._convert(source_codec="pcm_s16le", output_format="wav")
+        cmd = self._ffmpeg_cmd(mock_popen)
+        self.assertEqual(cmd[cmd.index("-c:a") + 1], "copy")
+
+    def test_other_pcm_is_converted_to_s16_for_wav(self):
+        _, mock_popen = self._convert(source_codec="pcm_f32le", output_format="wav")
+        cmd = self._ffmpeg_cmd(mock_popen)
+        self.assertEqual(cmd[cmd.index("-acodec") + 1], "pcm_s16le")
+        self.assertNotIn("-b:a", cmd)
+
+    def test_force_reencode_skips_probe_and_copy(self):
+        _, mock_popen = self._convert(source_codec="aac", force_reencode=True)
+        self.assertEqual(self.probes, 0)
+        self.assertIn("-acodec", self._ffmpeg_cmd(mock_popen))
+
+    def test_probe_result_is_cached_per_file(self):
+        with patch("video_converter.subprocess.run",
+                   return_value=MagicMock(returncode=0,
+                                          stdout="codec_name=aac\nduration=61.0\n")) as mock_run:
+            self.assertEqual(video_converter.probe_audio_codec("/in/a.mp4"), "aac")
+            self.assertEqual(video_converter.probe_media("/in/a.mp4"), ("aac", 61.0))
+        self.assertEqual(mock_run.call_count, 1)
+
+    def test_probe_without_audio_or_duration(self):
+        with patch("video_converter.subprocess.run",
+                   return_value=MagicMock(returncode=0, stdout="duration=N/A\n")):
+            self.assertEqual(video_converter.probe_media("/in/a.mp4"), (None, None))
+
+    def test_progress_is_read_from_stdout(self):
+        _, mock_popen = self._convert()
+        cmd = self._ffmpeg_cmd(mock_popen)
+        self.assertEqual(cmd[cmd.index("-progress") + 1], "pipe:1")
+        self.assertIn("-nostats", cmd)
+
+    def test_fast_probe_limits_analysis_and_maps_first_audio(self):
+        _, mock_run = self._convert(fast_probe=True)
+        cmd = self._ffmpeg_cmd(mock_run)
+        self.assertLess(cmd.index("-probesize"), cmd.index("-i"))
+        self.assertLess(cmd.index("-analyzeduration"), cmd.index("-i"))
+        self.assertEqual(cmd[cmd.index("-map") + 1], "0:a:0?")
+
+    def test_no_probe_limits_by_default(self):
+        _, mock_run = self._convert()
+        cmd = self._ffmpeg_cmd(mock_run)
+        self.assertNotIn("-probesize", cmd)
+        self.assertNotIn("-map", cmd)
+
+    def test_ffmpeg_failure_returns_failed(self):
+        ok, _ = self._convert(returncode=1)
+        self.assertEqual(ok, FAILED)
+        self.assertIn("boom", self.printed)
+        self.assertNotIn("detail 0\n", self.printed)
+
+    def test_ffmpeg_logs_errors_only_and_ignores_stdin(self):
+        _, mock_popen = self._convert()
+        cmd = self._ffmpeg_cmd(mock_popen)
+        self.assertEqual(cmd[cmd.index("-loglevel") + 1], "error")
+        self.assertIn("-nostdin", cmd)
+
+    def test_timeout_kills_hung_ffmpeg(self):
+        ok, _ = self._convert(hang=True, timeout=0.05)
+        self.assertEqual(ok, FAILED)
+        self.assertIn("timed out", self.printed)
+
+    def test_timeout_reported_before_timer_finishes(self):
+        class KillOnlyTimer:
+            """Fires at once but never sets `finished`, as if this thread
+            woke on the closed pipe before Timer.run() returned."""
+            def __init__(self, interval, function):
+                self.function = function
+                self.finished = threading.Event()
+
+            def start(self):
+                threading.Thread(target=self.function).start()
+
+            def cancel(self):
+                pass
+
+        with patch("video_converter.threading.Timer", KillOnlyTimer):
+            ok, _ = self._convert(hang=True, timeout=60)
+        self.assertEqual(ok, FAILED)
+        self.assertIn("timed out", self.printed)
+
+
+class TestConvertBatch(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.out_dir = self.tmp.name
+        video_converter._probe_cache.clear()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _fake_ffmpeg(self, batch_returncode=0):
+        def run(cmd, **kwargs):
+            if cmd[0] == "ffprobe":
+                return MagicMock(returncode=0, stdout="codec_name=h264_only\n")
+            if cmd.count("-i") > 1 and batch_returncode:
+                return MagicMock(returncode=batch_returncode, stderr="boom")
+            for arg in cmd:
+                if arg.startswith(self.out_dir):
+                    open(arg, "wb").close()
+            return MagicMock(returncode=0, stderr="")
+        return run
+
+    def _batch(self, paths, batch_returncode=0, **kwargs):
+        with patch("video_converter.subprocess.run",
+                   side_effect=self._fake_ffmpeg(batch_returncode)) as mock_run, \
+                patch("video_converter.subprocess.Popen", side_effect=fake_popen()) as mock_popen:
+            results = video_converter.convert_batch(
+                paths, self.out_dir, "m4a", "192k", log=MagicMock(), **kwargs)
+        ffmpeg_calls = [c.args[0] for c in mock_run.call_args_list + mock_popen.call_args_list
+                        if c.args[0][0] == "ffmpeg"]
+        return results, ffmpeg_calls
+
+    def test_one_process_maps_each_input_to_its_output(self):
+        results, calls = self._batch(["/in/a.mp4", "/in/b.mov"])
+        self.assertEqual(results, [CONVERTED, CONVERTED])
+        self.assertEqual(len(calls), 1)
+        cmd = calls[0]
+        self.assertEqual([cmd[i + 1] for i, a in enumerate(cmd) if a == "-i"],
+                         ["/in/a.mp4", "/in/b.mov"])
+        self.assertEqual([cmd[i + 1] for i, a in enumerate(cmd) if a == "-map"],
+                         ["0:a:0?", "1:a:0?"])
+        self.assertEqual(cmd[-1], os.path.join(self.out_dir, "b.m4a"))
+
+    def test_existing_outputs_are_left_out_of_the_batch(self):
+        open(os.path.join(self.out_dir, "a.m4a"), "w").close()
+        results, calls = self._batch(["/in/a.mp4", "/in/b.mov"])
+        self.assertEqual(results, [SKIPPED, CONVERTED])
+        self.assertNotIn("/in/a.mp4", calls[0])
+
+    def test_failed_batch_retries_files_individually(self):
+        results, calls = self._batch(["/in/a.mp4", "/in/b.mov"], batch_returncode=1)
+        self.assertEqual(results, [CONVERTED, CONVERTED])
+        self.assertEqual([c.count("-i") for c in calls], [2, 1, 1])
+
+    def test_groups_respect_batch_size(self):
+        paths = [f"/in/{n}.mp4" for n in range(5)]
+        groups = video_converter.batch_groups(paths, 2)
+        self.assertEqual([len(g) for g in groups], [2, 2, 1])
+        self.assertEqual(sum(groups, []), paths)
+
+    def test_groups_respect_arg_max(self):
+        paths = [f"/in/{'x' * 200}{n}.mp4" for n in range(10)]
+        with patch("video_converter.os.sysconf", return_value=2048, create=True):
+            groups = video_converter.batch_groups(paths, 16)
+        self.assertGreater(len(groups), 1)
+        self.assertEqual(sum(groups, []), paths)
+
+
+class TestBinary(unittest.TestCase):
+    def test_path_resolved_once(self):
+        with patch.dict(video_converter._binaries, clear=True), \
+                patch("video_converter.shutil.which", return_value="/opt/bin/ffmpeg") as which:
+            self.assertEqual(video_converter.binary("ffmpeg"), "/opt/bin/ffmpeg")
+            self.assertEqual(video_converter.binary("ffmpeg"), "/opt/bin/ffmpeg")
+        self.assertEqual(which.call_count, 1)
+
+    def test_missing_tool_keeps_bare_name(self):
+        with patch.dict(video_converter._binaries, clear=True), \
+                patch("video_converter.shutil.which", return_value=None):
+            self.assertEqual(video_converter.binary("ffprobe"), "ffprobe")
+            self.assertFalse(video_converter.binary_found("ffprobe"))
+
+    def test_relative_path_entry_counts_as_found(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            os.mkdir(os.path.join(tmp, "bin"))
+            tool = os.path.join(tmp, "bin", "ffmpeg")
+            open(tool, "w").close()
+            os.chmod(tool, 0o755)
+            cwd = os.getcwd()
+            os.chdir(tmp)
+            try:
+                with patch.dict(video_converter._binaries, clear=True), \
+                        patch.dict(os.environ, PATH="bin"):
+                    self.assertTrue(video_converter.binary_found("ffmpeg"))
+                    self.assertEqual(video_converter.binary("ffmpeg"),
+                                     os.path.join("bin", "ffmpeg"))
+            finally:
+                os.chdir(cwd)
+
+
+ENCODERS_OUTPUT = """Encoders:
+ V..... = Video
+ A..... = Audio
+ ------
+ V....D libx264              libx264 H.264 / AVC / MPEG-4 AVC
+ A....D aac                  AAC (Advanced Audio Coding)
+ A....D aac_at               aac (AudioToolbox) (codec aac)
+ A....D libmp3lame           libmp3lame MP3 (MPEG audio layer 3) (codec mp3)
+"""
+
+
+class TestEncoders(unittest.TestCase):
+    def _select(self, output_format, stdout):
+        with patch("video_converter.available_encoders", probe_encoders), \
+                patch("video_converter.subprocess.run",
+                      return_value=MagicMock(returncode=0, stdout=stdout)):
+            return video_converter.get_audio_codec(output_format)
+
+    def test_platform_aac_encoder_preferred(self):
+        self.assertEqual(self._select("m4a", ENCODERS_OUTPUT), "aac_at")
+
+    def test_video_encoders_and_legend_ignored(self):
+        with patch("video_converter.subprocess.run",
+                   return_value=MagicMock(returncode=0, stdout=ENCODERS_OUTPUT)):
+            encoders = probe_encoders()
+        self.assertEqual(encoders, {"aac", "aac_at", "libmp3lame"})
+
+    def test_defaults_when_nothing_better(self):
+        self.assertEqual(self._select("m4a", ""), "aac")
+        self.assertEqual(self._select("mp3", ""), "libmp3lame")
+        self.assertEqual(self._select("opus", ENCODERS_OUTPUT), "libopus")
+
+    def test_encoder_resolved_once_per_format(self):
+        with patch.dict(video_converter._codecs, clear=True), \
+                patch("video_converter.get_audio_codec", return_value="aac_at") as get_codec:
+            self.assertEqual(video_converter.audio_codec("m4a"), "aac_at")
+            self.assertEqual(video_converter.audio_codec("m4a"), "aac_at")
+        get_codec.assert_called_once_with("m4a")
+
+
+class TestConvertWithAv(unittest.TestCase):
+    def test_decoder_only_names_are_not_chosen_to_encode(self):
+        av = MagicMock()
+        # aac_at is listed by codecs_available but has no encoder here
+        av.codecs_available = {"aac", "aac_at"}
+
+        def codec(name, mode="r"):
+            if name != "aac" and mode == "w":
+                raise ValueError(name)
+            return MagicMock(id=name)
+        av.Codec.side_effect = codec
+        src, dst = MagicMock(), MagicMock()
+        src.streams.audio = [MagicMock()]
+        src.decode.return_value = []
+
+        def open_(path, mode="r"):
+            if mode == "w":
+                open(path, "wb").close()
+            return MagicMock(__enter__=MagicMock(return_value=dst if mode == "w" else src))
+        av.open.side_effect = open_
+        with tempfile.TemporaryDirectory() as out_dir, \
+                patch("video_converter._import_av", return_value=av):
+            ok = video_converter.convert_with_av("/in/a.mp4", out_dir, "m4a", "192k",
+                                                 force_reencode=True, log=MagicMock())
+        self.assertEqual(ok, CONVERTED)
+        self.assertEqual(dst.add_stream.call_args.args[0], "aac")
+
+
+class TestParseBitrate(unittest.TestCase):
+    def test_suffixes(self):
+        self.assertEqual(video_converter.parse_bitrate("192k"), 192000)
+        self.assertEqual(video_converter.parse_bitrate("1.5M"), 1500000)
+        self.assertEqual(video_converter.parse_bitrate("64000"), 64000)
+
+
+class TestHwaccel(unittest.TestCase):
+    def setUp(self):
+        video_converter.available_hwaccels.cache_clear()
+        self.addCleanup(video_converter.available_hwaccels.cache_clear)
+
+    def _probe(self, stdout):
+        return patch("video_converter.subprocess.run",
+                     return_value=MagicMock(returncode=0, stdout=stdout))
+
+    def test_hwaccels_probed_once(self):
+        with self._probe("Hardware acceleration methods:\nvideotoolbox\n\n") as mock_run:
+            self.assertEqual(video_converter.available_hwaccels(), {"videotoolbox"})
+            video_converter.available_hwaccels()
+        self.assertEqual(mock_run.call_count, 1)
+
+    def test_missing_method_falls_back_to_software(self):
+        with self._probe("Hardware acceleration methods:\nvaapi\n"), \
+                patch("builtins.print"):
+            self.assertIsNone(video_converter.resolve_hwaccel("cuda"))
+            self.assertEqual(video_converter.resolve_hwaccel("vaapi"), "vaapi")
+
+    def test_none_and_auto_need_no_probe(self):
+        with self._probe("") as mock_run:
+            self.assertIsNone(video_converter.resolve_hwaccel("none"))
+            self.assertEqual(video_converter.resolve_hwaccel("auto"), "auto")
+        mock_run.assert_not_called()
+
+    def test_hwaccel_precedes_input(self):
+        with tempfile.TemporaryDirectory() as out_dir, \
+                patch("video_converter.subprocess.Popen", side_effect=fake_popen(1)) as mock_popen:
+            video_converter.convert_video_to_audio(
+                "/in/a.mp4", out_dir, "m4a", "192k", force_reencode=True, hwaccel="cuda",
+                log=MagicMock())
+        cmd = mock_popen.call_args.args[0]
+        self.assertLess(cmd.index("-hwaccel"), cmd.index("-i"))
+        self.assertEqual(cmd[cmd.index("-hwaccel") + 1], "cuda")
+
+
+class TestGetVideoFiles(unittest.TestCase):
+    def test_extension_match_ignores_case_and_directories_in_path(self):
+        self.assertTrue(video_converter.has_video_extension("/Rec.Folder/Clip.MP4"))
+        self.assertFalse(video_converter.has_video_extension("/videos.mp4/notes.txt"))
+        self.assertFalse(video_converter.has_video_extension("mp4"))
+
+    def test_single_file_with_extension_skips_ffprobe(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "Meeting.MOV")
+            open(path, "w").close()
+            with patch("video_converter.looks_like_media") as probe:
+                self.assertEqual(video_converter.get_video_files(path), [path])
+        probe.assert_not_called()
+
+    def test_directory_scan_filters_and_sorts(self):
+        with tempfile.TemporaryDirectory() as folder:
+            for name in ("b.MOV", "a.mp4", "notes.txt", "mp4"):
+                open(os.path.join(folder, name), "w").close()
+            os.mkdir(os.path.join(folder, "clips.mkv"))
+            found = video_converter.get_video_files(folder)
+        self.assertEqual([os.path.basename(p) for p in found], ["a.mp4", "b.MOV"])
+
+
+class TestMain(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.folder = self.tmp.name
+        for name in ("a.mp4", "b.mov", "c.mkv", "notes.txt"):
+            open(os.path.join(self.folder, name), "w").close()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _main(self, *argv, convert=None, ffmpeg="/usr/bin/ffmpeg"):
+        convert = convert or MagicMock(return_value=CONVERTED)
+        with patch.object(sys, "argv", ["video_converter.py", self.folder, *argv]), \
+                patch("video_converter.ProcessPoolExecutor", ThreadPoolExecutor), \
+                patch("video_converter.convert_video_to_audio", convert), \
+                patch("video_converter.os.cpu_count", return_value=8), \
+                patch.dict(video_converter._binaries, ffmpeg=ffmpeg), \
+                patch("builtins.print") as mock_print:
+            try:
+                video_converter.main()
+            finally:
+                self.printed = "\n".join(str(c.args[0]) for c in mock_print.call_args_list
+                                         if c.args)
+        return convert
+
+    def test_every_file_converted_with_shared_thread_budget(self):
+        convert = self._main("--jobs", "2")
+        converted = sorted(os.path.basename(c.args[0]) for c in convert.call_args_list)
+        self.assertEqual(converted, ["a.mp4", "b.mov", "c.mkv"])
+        # 8 cores / 2 jobs → 4 ffmpeg threads each
+        self.assertEqual({c.args[5] for c in convert.call_args_list}, {4})
+
+    def test_command_parts_built_once_per_run(self):
+        with patch("video_converter._command_parts", return_value=((), ())) as build:
+            convert = self._main("--jobs", "2")
+        build.assert_called_once_with(4, None, False)
+        self.assertEqual({c.kwargs["command_parts"] for c in convert.call_args_list}, {((), ())})
+
+    def test_jobs_capped_by_file_count(self):
+        convert = self._main("--jobs", "16")
+        # 3 files → 3 workers → 8 // 3 threads each
+        self.assertEqual({c.args[5] for c in convert.call_args_list}, {2})
+
+    def test_batch_size_dispatches_groups(self):
+        batch = MagicMock(side_effect=lambda paths, *a, **kw: [CONVERTED] * len(paths))
+        convert = MagicMock(return_value=CONVERTED)
+        with patch("video_converter.convert_batch", batch):
+            self._main("--batch-size", "2", convert=convert)
+        self.assertEqual([len(c.args[0]) for c in batch.call_args_list], [2])
+        self.assertEqual(convert.call_count, 1)
+
+    def test_existing_outputs_are_skipped_before_dispatch(self):
+        open(os.path.join(self.folder, "a.m4a"), "w").close()
+        convert = self._main()
+        converted = sorted(os.path.basename(c.args[0]) for c in convert.call_args_list)
+        self.assertEqual(converted, ["b.mov", "c.mkv"])
+
+    def test_summary_counts_skipped_separately(self):
+        open(os.path.join(self.folder, "a.m4a"), "w").close()
+        self._main()
+        self.assertIn("Converted: 2", self.printed)
+        self.assertIn("Skipped: 1", self.printed)
+
+    def test_force_dispatches_existing_outputs(self):
+        open(os.path.join(self.folder, "a.m4a"), "w").close()
+        convert = self._main("--force")
+        self.assertEqual(convert.call_count, 3)
+
+    def test_all_converted_dispatches_nothing(self):
+        for name in ("a", "b", "c"):
+            open(os.path.join(self.folder, f"{name}.m4a"), "w").close()
+        convert = self._main()
+        convert.assert_not_called()
+
+    def test_parallel_worker_messages_are_written_by_main(self):
+        def convert(path, *args, log=print, **kwargs):
+            log(f"done {os.path.basename(path)}")
+            return CONVERTED
+        # Written with tqdm.write, which goes to sys.stdout rather than print
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            self._main("--jobs", "2", convert=MagicMock(side_effect=convert))
+        for name in ("a.mp4", "b.mov", "c.mkv"):
+            self.assertIn(f"done {name}", out.getvalue())
+
+    def test_progress_bars_only_without_parallel_jobs(self):
+        convert = self._main("--jobs", "1")
+        self.assertEqual({c.kwargs["progress"] for c in convert.call_args_list}, {True})
+        convert = self._main("--jobs", "2")
+        self.assertEqual({c.kwargs["progress"] for c in convert.call_args_list}, {False})
+
+    def test_single_file_skips_tqdm_import(self):
+        with patch.dict(sys.modules), \
+                patch.object(sys, "argv", ["video_converter.py", os.path.join(self.folder, "a.mp4")]), \
+                patch("video_converter.ProcessPoolExecutor", ThreadPoolExecutor), \
+                patch("video_converter.convert_video_to_audio", return_value=CONVERTED), \
+                patch.dict(video_converter._binaries, ffmpeg="/usr/bin/ffmpeg"), \
+                patch("builtins.print"):
+            sys.modules.pop("tqdm", None)
+            video_converter.main()
+            self.assertNotIn("tqdm", sys.modules)
+
+    def test_missing_ffmpeg_exits_before_dispatch(self):
+        convert = MagicMock(return_value=CONVERTED)
+        with self.assertRaises(SystemExit) as cm:
+            self._main(convert=convert, ffmpeg=None)
+        self.assertEqual(cm.exception.code, 1)
+        convert.assert_not_called()
+
+    def test_ffmpeg_found_through_relative_path_entry_runs(self):
+        convert = self._main(ffmpeg=os.path.join("bin", "ffmpeg"))
+        self.assertEqual(convert.call_count, 3)
+
+    def test_workers_are_seeded_with_resolved_binaries_and_encoder(self):
+        with patch("video_converter._init_worker") as init:
+            self._main("--jobs", "2")
+        binaries, codecs = init.call_args.args
+        self.assertEqual(set(binaries), {"ffmpeg", "ffprobe"})
+        self.assertEqual(codecs, {"m4a": "aac"})
+
+    def test_single_job_converts_without_a_pool(self):
+        threads = []
+        convert = MagicMock(side_effect=lambda *a, **kw:
+                            threads.append(threading.current_thread()) or CONVERTED)
+        self._main("--jobs", "1", convert=convert)
+        self.assertEqual(threads, [threading.main_thread()] * 3)
+
+    def test_non_positive_timeout_is_rejected(self):
+        convert = MagicMock(return_value=CONVERTED)
+        with patch("sys.stderr", io.StringIO()), self.assertRaises(SystemExit) as cm:
+            self._main("--timeout", "0", convert=convert)
+        self.assertEqual(cm.exception.code, 2)
+        convert.assert_not_called()
+
+    def test_dry_run_lists_pending_without_converting(self):
+        open(os.path.join(self.folder, "a.m4a"), "w").close()
+        convert = self._main("--dry-run")
+        convert.assert_not_called()
+        self.assertEqual(self.printed.splitlines(),
+                         [os.path.join(self.folder, n) for n in ("b.mov", "c.mkv")])
+
+    def _convert_writing_output(self, path, output_dir, fmt, *args, **kwargs):
+        open(os.path.join(output_dir, video_converter.audio_filename(path, fmt)), "w").close()
+        return CONVERTED
+
+    def test_manifest_records_conversions(self):
+        self._main("--manifest", convert=MagicMock(side_effect=self._convert_writing_output))
+        manifest = video_converter.load_manifest(
+            os.path.join(self.folder, video_converter.MANIFEST_NAME))
+        self.assertEqual(sorted(manifest), ["a.m4a", "b.m4a", "c.m4a"])
+        self.assertEqual(manifest["a.m4a"]["source"], os.path.join(self.folder, "a.mp4"))
+
+    def test_manifest_redoes_outputs_of_changed_sources(self):
+        self._main("--manifest", convert=MagicMock(side_effect=self._convert_writing_output))
+        with open(os.path.join(self.folder, "b.mov"), "w") as f:
+            f.write("re-recorded")
+        convert = self._main("--manifest", convert=MagicMock(return_value=CONVERTED))
+        self.assertEqual([os.path.basename(c.args[0]) for c in convert.call_args_list], ["b.mov"])
+        # The existing output must be overwritten, not skipped
+        self.assertTrue(convert.call_args.args[4])
+
+    def test_no_manifest_written_by_default(self):
+        self._main(convert=MagicMock(side_effect=self._convert_writing_output))
+        self.assertFalse(os.path.exists(os.path.join(self.folder, video_converter.MANIFEST_NAME)))
+
+    def test_av_backend_converts_each_file_in_process(self):
+        av_convert = MagicMock(return_value=CONVERTED)
+        convert = MagicMock(return_value=CONVERTED)
+        with patch("video_converter._import_av"), \
+                patch("video_converter.convert_with_av", av_convert):
+            self._main("--backend", "av", "--batch-size", "8", convert=convert, ffmpeg=None)
+        self.assertEqual(av_convert.call_count, 3)
+        convert.assert_not_called()
+
+    def test_av_backend_without_pyav_exits(self):
+        with patch("video_converter._import_av", side_effect=RuntimeError("no av")), \
+                self.assertRaises(SystemExit) as cm:
+            self._main("--backend", "av")
+        self.assertEqual(cm.exception.code, 1)
+
+    def test_failure_exits_non_zero(self):
+        convert = MagicMock(side_effect=lambda path, *a, **kw:
+                            FAILED if path.endswith("b.mov") else CONVERTED)
+        with self.assertRaises(SystemExit) as cm:
+            self._main(convert=convert)
+        self.assertEqual(cm.exception.code, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -42,13 +42,14 @@ warnings.filterwarnings("ignore", message=r".*load_with_torchcodec.*")
 warnings.filterwarnings("ignore", message=r".*AudioMetaData has been deprecated.*")
 
 import os
+import re
 import argparse
 import platform
 from tqdm import tqdm
 import time
 import sys
-import threading
 import datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # Speaker labels for different languages
 SPEAKER_LABELS = {
@@ -61,6 +62,25 @@ SPEAKER_LABELS = {
     "ru": "Спикер",    # Russian
 }
 
+# Audio formats picked up in directory mode, compared against the lowercased
+# extension.
+AUDIO_SUFFIXES = frozenset({".m4a", ".opus"})
+
+# Name filters for directory scans. One compiled, case-insensitive search of
+# the name's tail; no lowercased copy or splitext tuple per entry.
+_AUDIO_NAME_RE = re.compile(
+    "(?:%s)\\Z" % "|".join(re.escape(s) for s in sorted(AUDIO_SUFFIXES)), re.IGNORECASE
+)
+
+# Formats pyannote can't read directly; converted to 16 kHz WAV first.
+_DIARIZE_CONVERT_SUFFIXES = frozenset({".m4a", ".opus", ".mp3", ".ogg"})
+
+# Prefix of the files unify writes; excluded when collecting transcripts.
+_UNIFIED_PREFIX = "unified_transcript"
+_TRANSCRIPT_NAME_RE = re.compile(
+    "(?!%s)(?i:.*\\.txt)\\Z" % re.escape(_UNIFIED_PREFIX), re.DOTALL
+)
+
 # ---------------------------------------------------------------------------
 # Pluggable transcription engines
 # ---------------------------------------------------------------------------
@@ -68,7 +88,54 @@ SPEAKER_LABELS = {
 # rest of this module (diarization alignment, output formatting) is engine-
 # agnostic. Pick via --engine or TRANSCRIPTION_ENGINE env var.
 
-ENGINES = ("mlx-whisper", "faster-whisper", "openai-whisper")
+ENGINES = ("mlx-whisper", "faster-whisper", "openai-whisper", "openvino")
+
+# CTranslate2 quantization modes accepted by faster-whisper's WhisperModel.
+COMPUTE_TYPES = ("auto", "int8", "int8_float16", "int8_float32", "float16", "float32")
+
+# Inference devices for openai-whisper / faster-whisper / openvino.
+# mlx-whisper always runs on the Apple GPU and ignores this. gpu/npu are
+# OpenVINO device names (Intel iGPU/dGPU, NPU) and only valid there.
+DEVICES = ("auto", "cpu", "cuda", "mps", "gpu", "npu")
+_OPENVINO_ONLY_DEVICES = frozenset({"gpu", "npu"})
+
+# OpenMP/BLAS pools read these once, when torch / CTranslate2 is first
+# imported, so they must be in the environment before any engine loads.
+_THREAD_ENV_VARS = ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS")
+
+
+def _physical_cores() -> int:
+    """Physical core count (psutil if installed), else the logical count.
+
+    GEMM kernels gain nothing from SMT siblings and lose to the contention,
+    so the physical count is the better default thread budget.
+    """
+    try:
+        import psutil
+        cores = psutil.cpu_count(logical=False)
+    except ImportError:
+        cores = None
+    return cores or os.cpu_count() or 1
+
+
+def _configure_threads(threads=None) -> int:
+    """Export the BLAS/OpenMP thread count and return the one in effect.
+
+    An explicit `threads` overrides whatever the environment says; otherwise
+    the physical core count is only a default, so a caller's own
+    OMP_NUM_THREADS etc. still wins.
+    """
+    n = threads or _physical_cores()
+    for var in _THREAD_ENV_VARS:
+        if threads:
+            os.environ[var] = str(n)
+        else:
+            os.environ.setdefault(var, str(n))
+    try:
+        return int(os.environ["OMP_NUM_THREADS"])
+    except ValueError:
+        return n
+
 
 _MLX_REPOS = {
     "tiny":           "mlx-community/whisper-tiny-mlx",
@@ -95,12 +162,39 @@ _OPENAI_NAMES = {
     "large": "large-v3", "large-v3": "large-v3",
 }
 
+# Pre-exported OpenVINO IR models published by Intel on the HF hub.
+_OPENVINO_REPOS = {
+    "tiny":     "OpenVINO/whisper-tiny-fp16-ov",
+    "base":     "OpenVINO/whisper-base-fp16-ov",
+    "small":    "OpenVINO/whisper-small-fp16-ov",
+    "medium":   "OpenVINO/whisper-medium-fp16-ov",
+    "large":    "OpenVINO/whisper-large-v3-fp16-ov",
+    "large-v3": "OpenVINO/whisper-large-v3-fp16-ov",
+}
+
+# Compiled-kernel cache for OpenVINO. GPU/NPU kernel compilation dominates
+# the first call (seconds); with a CACHE_DIR later processes load the
+# compiled blobs in tens of ms. One subdirectory per (model, device).
+_OPENVINO_CACHE_ROOT = os.path.expanduser("~/.cache/ov_whisper")
+
 # Module-level cache: fine for one-shot CLI use (the auto_transcribe_meet.sh
 # pattern of one subprocess per pass). Callers importing this as a library
 # and switching models frequently across many files should be aware there
 # is no eviction policy here.
 _MODEL_CACHE = {}
 
+
+def _cached_model(key, load):
+    """Return the model cached under `key`, calling `load()` only on a miss.
+
+    Keys are tuples starting with the engine tag (e.g. ("openai", "medium"))
+    so the same model name loaded by two engines never collides.
+    """
+    model = _MODEL_CACHE.get(key)
+    if model is None:
+        model = _MODEL_CACHE[key] = load()
+    return model
+
 # Model name aliases that only exist in the MLX repo set. Passing these
 # to faster-whisper or openai-whisper would surface as opaque "model not
 # found" errors from the underlying library — guard them at the dispatch
@@ -164,18 +258,108 @@ def detect_default_engine() -> str:
 
 
 def transcribe_audio(engine: str, audio_path: str, model_name: str,
-                     language: str, word_timestamps: bool = False) -> dict:
-    """Engine-agnostic transcription. Returns {'segments': [...], 'text': str}."""
+                     language: str, word_timestamps: bool = False,
+                     chunk_seconds: int = None, **options) -> dict:
+    """Engine-agnostic transcription. Returns {'segments': [...], 'text': str}.
+
+    `options` are engine tuning knobs (e.g. compute_type) forwarded to the
+    adapter as keywords. Every adapter accepts the full set and ignores the
+    ones its backend has no equivalent for, so callers can pass one dict
+    regardless of which engine was auto-detected.
+
+    With `chunk_seconds`, long files are split and transcribed in parallel
+    worker processes (see _transcribe_chunked).
+
+    An `on_segment` callable in `options` is called with each segment dict as
+    soon as it is decoded, by engines that decode lazily (faster-whisper).
+    Others ignore it, as does chunked mode (callbacks don't cross processes).
+    Likewise a `log` callable receives chunked mode's splitting messages.
+    """
     _require_mlx_only(engine, model_name)
+    if chunk_seconds:
+        return _transcribe_chunked(engine, audio_path, model_name, language,
+                                   word_timestamps, chunk_seconds, **options)
     if engine == "openai-whisper":
-        return _transcribe_openai(audio_path, model_name, language, word_timestamps)
+        return _transcribe_openai(audio_path, model_name, language, word_timestamps, **options)
     if engine == "mlx-whisper":
-        return _transcribe_mlx(audio_path, model_name, language, word_timestamps)
+        return _transcribe_mlx(audio_path, model_name, language, word_timestamps, **options)
     if engine == "faster-whisper":
-        return _transcribe_faster(audio_path, model_name, language, word_timestamps)
+        return _transcribe_faster(audio_path, model_name, language, word_timestamps, **options)
+    if engine == "openvino":
+        return _transcribe_openvino(audio_path, model_name, language, word_timestamps, **options)
     raise ValueError(f"Unknown engine: {engine!r}. Valid: {', '.join(ENGINES)}")
 
 
+# Whisper's decoder stops scaling past roughly this many threads, so chunked
+# transcription gives each worker process this many cores and runs
+# cpu_count // _CHUNK_THREADS_PER_WORKER workers side by side.
+_CHUNK_THREADS_PER_WORKER = 4
+
+
+def _transcribe_chunk(job):
+    """ProcessPool worker: transcribe one chunk, shifting times by its offset."""
+    engine, chunk_path, offset, model_name, language, word_timestamps, options = job
+    result = transcribe_audio(engine, chunk_path, model_name, language,
+                              word_timestamps, **options)
+    segments = []
+    for seg in result.get("segments", []):
+        seg = dict(seg)
+        seg["start"] += offset
+        seg["end"] += offset
+        if seg.get("words"):
+            seg["words"] = [dict(w, start=w["start"] + offset, end=w["end"] + offset)
+                            for w in seg["words"]]
+        segments.append(seg)
+    return {"segments": segments, "text": result.get("text", "")}
+
+
+def _transcribe_chunked(engine, audio_path, model_name, language, word_timestamps,
+                        chunk_seconds, on_segment=None, log=print, **options):
+    """Split `audio_path` into `chunk_seconds` pieces and transcribe them in parallel.
+
+    Files shorter than two chunks (or whose duration can't be probed) are not
+    worth the split and go straight to the engine. Each worker process loads
+    its own model, so memory use scales with the worker count, and words that
+    straddle a cut point may be lost or duplicated. Splitting messages go
+    through `log`; without a bar of its own, the split can't garble the
+    caller's.
+    """
+    import glob
+    import tempfile
+    from audio_splitter import split_audio_file
+
+    duration = _audio_duration(audio_path)
+    if duration is None or duration <= 2 * chunk_seconds:
+        return transcribe_audio(engine, audio_path, model_name, language,
+                                word_timestamps, on_segment=on_segment, **options)
+
+    ext = os.path.splitext(audio_path)[1].lstrip(".").lower() or "m4a"
+    base_name = os.path.splitext(os.path.basename(audio_path))[0]
+    with tempfile.TemporaryDirectory(prefix="transcribe-chunks-") as tmp_dir:
+        split_audio_file(audio_path, tmp_dir, chunk_seconds, ext, progress=False, log=log)
+        parts = sorted(glob.glob(os.path.join(glob.escape(tmp_dir), f"{glob.escape(base_name)}_part*.{ext}")))
+        if not parts:
+            raise RuntimeError(f"Splitting {audio_path!r} into chunks produced no files")
+        # Each worker gets its own slice of the cores instead of every
+        # process sizing its thread pool to the whole machine, unless the
+        # caller chose a thread count.
+        worker_options = dict(options)
+        if worker_options.get("threads") is None:
+            worker_options["threads"] = _CHUNK_THREADS_PER_WORKER
+        jobs = [
+            (engine, part, i * chunk_seconds, model_name, language, word_timestamps, worker_options)
+            for i, part in enumerate(parts)
+        ]
+        workers = max(1, _physical_cores() // worker_options["threads"])
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+            # map() keeps results in chunk order regardless of completion order.
+            results = list(executor.map(_transcribe_chunk, jobs))
+
+    segments = [seg for result in results for seg in result["segments"]]
+    text = " ".join(result["text"].strip() for result in results if result["text"].strip())
+    return {"segments": segments, "text": text}
+
+
 # A clip's language ID is only trustworthy if the sample actually contains
 # speech. Whisper always returns *some* language even for silence, so a
 # recording that opens with dead air (e.g. the other party hasn't joined the
@@ -227,25 +411,21 @@ def _detect_clip(engine: str, clip_path: str, model_name: str):
         result = mlx_whisper.transcribe(clip_path, path_or_hf_repo=repo, language=None)
         return result.get("segments", []), (result.get("language", "") or "")
     if engine == "faster-whisper":
-        from faster_whisper import WhisperModel
-        name = _FASTER_NAMES.get(model_name, model_name)
-        key = ("faster", name)
-        if key not in _MODEL_CACHE:
-            _MODEL_CACHE[key] = WhisperModel(name, device="cpu", compute_type="auto")
-        model = _MODEL_CACHE[key]
+        model = _load_faster_model(_FASTER_NAMES.get(model_name, model_name))
         # The segment generator is lazy — materialize it so _has_speech can
         # inspect no_speech_prob before we trust info.language.
         segments, info = model.transcribe(clip_path, language=None)
         return list(segments), (getattr(info, "language", "") or "")
     if engine == "openai-whisper":
-        import whisper
-        name = _OPENAI_NAMES.get(model_name, model_name)
-        key = ("openai", name)
-        if key not in _MODEL_CACHE:
-            _MODEL_CACHE[key] = whisper.load_model(name, device="cpu")
-        model = _MODEL_CACHE[key]
-        result = model.transcribe(clip_path, language=None, fp16=False)
+        device, model = _load_openai_model(_OPENAI_NAMES.get(model_name, model_name))
+        result = model.transcribe(clip_path, language=None, fp16=device != "cpu")
         return result.get("segments", []), (result.get("language", "") or "")
+    if engine == "openvino":
+        # WhisperPipeline doesn't report the language it detected.
+        raise ValueError(
+            "Language detection is not supported by the openvino engine. "
+            "Use --engine faster-whisper / openai-whisper / mlx-whisper for --detect-language."
+        )
     raise ValueError(f"Unknown engine: {engine!r}. Valid: {', '.join(ENGINES)}")
 
 
@@ -332,21 +512,88 @@ def detect_language(engine: str, audio_path: str, model_name: str,
     return Counter(speech_langs).most_common(1)[0][0]
 
 
-def _transcribe_openai(audio_path, model_name, language, word_timestamps):
+def _progress_verbose():
+    """`verbose` value for openai/mlx transcribe(): False draws their own
+    tqdm bar over decoded audio, None stays silent.
+
+    Bars are only shown on an interactive terminal; Automator/launchd runs
+    pipe output to a log file, where a redrawn bar writes thousands of lines.
+    """
+    return False if sys.stderr.isatty() else None
+
+
+def _resolve_torch_device(device=None) -> str:
+    """Concrete torch device for openai-whisper.
+
+    "auto" picks CUDA when torch can see a GPU, else CPU. MPS is only used
+    when asked for explicitly: openai-whisper's sparse ops are unreliable on
+    it, and Apple Silicon users are better served by mlx-whisper anyway.
+    """
+    if device in _OPENVINO_ONLY_DEVICES:
+        raise ValueError(f"Device {device!r} is only available with --engine openvino.")
+    if device and device != "auto":
+        return device
+    try:
+        import torch
+        if torch.cuda.is_available():
+            return "cuda"
+    except Exception:
+        pass
+    return "cpu"
+
+
+def _load_openai_model(name, device=None):
+    """Return (resolved_device, cached openai-whisper model)."""
     import whisper
-    name = _OPENAI_NAMES.get(model_name, model_name)
-    key = ("openai", name)
-    if key not in _MODEL_CACHE:
-        _MODEL_CACHE[key] = whisper.load_model(name, device="cpu")
-    model = _MODEL_CACHE[key]
+    device = _resolve_torch_device(device)
+    return device, _cached_model(
+        ("openai", name, device), lambda: whisper.load_model(name, device=device)
+    )
+
+
+# Temperature fallback schedule used by --quality (openai-whisper's default):
+# retry a window at rising temperatures when greedy decoding loops or stalls.
+_QUALITY_TEMPERATURES = (0.0, 0.2, 0.4, 0.6, 0.8, 1.0)
+
+
+def _decode_kwargs(beam_size=None, temperature=None, condition_on_previous_text=None,
+                   beam_search=True):
+    """Decode options for an engine's transcribe(), omitting unset ones.
+
+    Unset options keep each engine's own default. beam_size <= 1 means greedy
+    decoding, which openai-whisper spells as beam_size=None; engines without
+    beam search (`beam_search=False`, i.e. mlx-whisper) never get it.
+    """
+    kwargs = {}
+    if beam_search and beam_size is not None:
+        kwargs["beam_size"] = beam_size
+    if temperature is not None:
+        kwargs["temperature"] = temperature
+    if condition_on_previous_text is not None:
+        kwargs["condition_on_previous_text"] = condition_on_previous_text
+    return kwargs
+
+
+def _transcribe_openai(audio_path, model_name, language, word_timestamps,
+                       device=None, threads=None, beam_size=None, temperature=None,
+                       condition_on_previous_text=None, **_ignored):
+    device, model = _load_openai_model(_OPENAI_NAMES.get(model_name, model_name), device)
+    if threads and device == "cpu":
+        import torch
+        torch.set_num_threads(threads)
+    # FP16 only off-CPU; on CPU whisper would warn and fall back to FP32 anyway.
+    # openai-whisper runs a 1-wide beam search for beam_size=1; None is greedy.
+    decode = _decode_kwargs(beam_size if beam_size and beam_size > 1 else None,
+                            temperature, condition_on_previous_text)
     result = model.transcribe(
-        audio_path, language=language, fp16=False,
-        word_timestamps=word_timestamps,
+        audio_path, language=language, fp16=device != "cpu",
+        word_timestamps=word_timestamps, verbose=_progress_verbose(), **decode,
     )
     return {"segments": result.get("segments", []), "text": result.get("text", "")}
 
 
-def _transcribe_mlx(audio_path, model_name, language, word_timestamps):
+def _transcribe_mlx(audio_path, model_name, language, word_timestamps,
+                    temperature=None, condition_on_previous_text=None, **_ignored):
     try:
         import mlx_whisper
     except ImportError as e:
@@ -362,32 +609,98 @@ def _transcribe_mlx(audio_path, model_name, language, word_timestamps):
         path_or_hf_repo=repo,
         language=language,
         word_timestamps=word_timestamps,
+        verbose=_progress_verbose(),
+        # mlx-whisper raises NotImplementedError for beam search; it is always greedy.
+        **_decode_kwargs(temperature=temperature,
+                         condition_on_previous_text=condition_on_previous_text,
+                         beam_search=False),
     )
     return {"segments": result.get("segments", []), "text": result.get("text", "")}
 
 
-def _transcribe_faster(audio_path, model_name, language, word_timestamps):
+# Batched inference only pays off once there are several 30s windows to pack
+# into one forward pass; below this the pipeline's VAD pre-pass costs more
+# than it saves.
+_BATCHED_MIN_SECONDS = 120
+
+
+def _audio_duration(audio_path):
+    """Duration in seconds via audio_splitter.get_duration, or None if unknown."""
+    try:
+        from audio_splitter import get_duration
+        return get_duration(audio_path)
+    except Exception:
+        return None
+
+
+def _load_faster_model(name, compute_type="auto", device=None, threads=None):
+    """Cached faster-whisper WhisperModel for (name, compute_type, device, threads).
+
+    compute_type="auto" (the default) lets CTranslate2 pick the best
+    available quantization for the device (int8 needs AVX2 on x86_64; on
+    Apple Silicon int8 works via NEON; CUDA gets float16). Hard-coding int8
+    would break on older x86 chips, so forcing it is left to --compute-type.
+    device="auto" likewise lets CTranslate2 use CUDA when it sees a GPU.
+    threads=None (cpu_threads=0) leaves the pool size to OMP_NUM_THREADS.
+    """
+    from faster_whisper import WhisperModel
+    compute_type = compute_type or "auto"
+    device = device or "auto"
+    if device == "mps":
+        raise ValueError(
+            "faster-whisper (CTranslate2) has no MPS backend. Use --device cpu, "
+            "or --engine mlx-whisper for the Apple GPU."
+        )
+    if device in _OPENVINO_ONLY_DEVICES:
+        raise ValueError(f"Device {device!r} is only available with --engine openvino.")
+    threads = threads or 0
+    return _cached_model(
+        ("faster", name, compute_type, device, threads),
+        lambda: WhisperModel(name, device=device, compute_type=compute_type,
+                             cpu_threads=threads),
+    )
+
+
+def _transcribe_faster(audio_path, model_name, language, word_timestamps,
+                       compute_type="auto", batch_size=None, device=None, threads=None,
+                       beam_size=None, temperature=None, condition_on_previous_text=None,
+                       on_segment=None, **_ignored):
     try:
-        from faster_whisper import WhisperModel
+        import faster_whisper  # noqa: F401
     except ImportError as e:
         raise RuntimeError(
             "faster-whisper is not installed. Run: pip install faster-whisper"
         ) from e
     name = _FASTER_NAMES.get(model_name, model_name)
-    key = ("faster", name)
-    if key not in _MODEL_CACHE:
-        # compute_type="auto" lets CTranslate2 pick the best available
-        # quantization for the host CPU (int8 needs AVX2 on x86_64; on
-        # Apple Silicon int8 works via NEON). Hard-coding int8 would
-        # break on older x86 chips.
-        _MODEL_CACHE[key] = WhisperModel(name, device="cpu", compute_type="auto")
-    model = _MODEL_CACHE[key]
-    segments_iter, _info = model.transcribe(
-        audio_path, language=language, word_timestamps=word_timestamps,
+    model = _load_faster_model(name, compute_type, device, threads)
+    transcriber = model
+    extra = _decode_kwargs(beam_size, temperature, condition_on_previous_text)
+    if batch_size:
+        duration = _audio_duration(audio_path)
+        if duration is not None and duration >= _BATCHED_MIN_SECONDS:
+            try:
+                from faster_whisper import BatchedInferencePipeline
+            except ImportError:
+                # faster-whisper < 1.1 has no batched pipeline; decode sequentially.
+                BatchedInferencePipeline = None
+            if BatchedInferencePipeline is not None:
+                transcriber = _cached_model(
+                    ("faster-batched", name, compute_type or "auto", device or "auto",
+                     threads or 0),
+                    lambda: BatchedInferencePipeline(model=model),
+                )
+                extra["batch_size"] = batch_size
+    segments_iter, info = transcriber.transcribe(
+        audio_path, language=language, word_timestamps=word_timestamps, **extra,
     )
     segments = []
     text_parts = []
+    # Segments are decoded lazily as the generator is consumed, so advancing
+    # a bar by each segment's end time tracks real decode progress.
+    progress = tqdm(total=round(getattr(info, "duration", 0) or 0, 1), unit="s",
+                    leave=False, disable=not sys.stderr.isatty())
     for seg in segments_iter:
+        progress.update(max(0.0, round(seg.end - progress.n, 1)))
         seg_dict = {"start": seg.start, "end": seg.end, "text": seg.text}
         if word_timestamps and getattr(seg, "words", None):
             seg_dict["words"] = [
@@ -395,11 +708,79 @@ def _transcribe_faster(audio_path, model_name, language, word_timestamps):
             ]
         segments.append(seg_dict)
         text_parts.append(seg.text)
+        if on_segment:
+            on_segment(seg_dict)
+    progress.close()
     # faster-whisper segments often start with a leading space; strip the
     # joined result so result["text"] matches openai/mlx behavior.
     return {"segments": segments, "text": "".join(text_parts).strip()}
 
 
+def _load_audio_16k(audio_path):
+    """Decode `audio_path` to 16 kHz mono float32 samples via ffmpeg."""
+    import subprocess
+    import numpy as np
+    proc = subprocess.run(
+        ["ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "error", "-i", audio_path,
+         "-f", "f32le", "-ac", "1", "-ar", "16000", "-"],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(
+            f"ffmpeg could not decode {audio_path!r}: {proc.stderr.decode(errors='replace').strip()}"
+        )
+    return np.frombuffer(proc.stdout, dtype=np.float32)
+
+
+def _load_openvino_pipeline(model_name, device=None):
+    """Cached OpenVINO GenAI WhisperPipeline for (model, device).
+
+    Compiled kernels persist under _OPENVINO_CACHE_ROOT, so only the first
+    run per (model, device) pays for compilation.
+    """
+    import openvino_genai
+    ov_device = {None: "AUTO", "auto": "AUTO", "cpu": "CPU", "gpu": "GPU", "npu": "NPU"}.get(device)
+    if ov_device is None:
+        raise ValueError(
+            f"Device {device!r} is not available with --engine openvino. Use auto, cpu, gpu or npu."
+        )
+    repo = _OPENVINO_REPOS.get(model_name)
+    if not repo:
+        raise ValueError(f"Unknown OpenVINO model: {model_name!r}. Valid: {', '.join(_OPENVINO_REPOS)}")
+
+    def load():
+        from huggingface_hub import snapshot_download
+        model_dir = snapshot_download(repo_id=repo)
+        cache_dir = os.path.join(_OPENVINO_CACHE_ROOT, f"{repo.split('/')[-1]}-{ov_device.lower()}")
+        os.makedirs(cache_dir, exist_ok=True)
+        return openvino_genai.WhisperPipeline(model_dir, ov_device, CACHE_DIR=cache_dir)
+
+    return _cached_model(("openvino", repo, ov_device), load)
+
+
+def _transcribe_openvino(audio_path, model_name, language, word_timestamps,
+                         device=None, beam_size=None, **_ignored):
+    try:
+        import openvino_genai  # noqa: F401
+    except ImportError as e:
+        raise RuntimeError(
+            "OpenVINO GenAI is not installed. Run: pip install openvino-genai"
+        ) from e
+    pipeline = _load_openvino_pipeline(model_name, device)
+    kwargs = {"task": "transcribe", "return_timestamps": True}
+    if language:
+        kwargs["language"] = f"<|{language}|>"
+    if beam_size and beam_size > 1:
+        kwargs["num_beams"] = beam_size
+    result = pipeline.generate(_load_audio_16k(audio_path), **kwargs)
+    # Chunks carry segment-level timestamps only; word_timestamps is ignored.
+    segments = [
+        {"start": chunk.start_ts, "end": chunk.end_ts, "text": chunk.text}
+        for chunk in (getattr(result, "chunks", None) or [])
+    ]
+    return {"segments": segments, "text": (result.texts[0] if result.texts else "").strip()}
+
+
 def load_diarization_pipeline(auth_token: str = None):
     """
     Load the Pyannote speaker diarization pipeline.
@@ -594,15 +975,267 @@ def format_diarized_transcript(merged_segments, language: str, include_timestamp
 
     return "\n".join(lines)
 
+# ---------------------------------------------------------------------------
+# Content-addressed transcript cache
+# ---------------------------------------------------------------------------
+# The skip-if-.txt-exists check misses renamed, moved, or re-downloaded audio
+# (the Drive poller stages every recording under a fresh path). Transcription
+# is deterministic for a given (audio bytes, engine, model, language, options),
+# so finished transcripts are also stored in a SQLite index keyed by a hash of
+# exactly that. The cache is best-effort: any I/O or SQLite error is treated
+# as a miss and never fails the transcription itself.
+
+_TRANSCRIPT_CACHE_PATH = os.path.expanduser("~/.cache/transcribe/index.sqlite")
+
+
+def _transcript_cache_key(audio_path: str, engine: str, model_name: str, language: str,
+                          mode: str, engine_options: dict = None) -> str:
+    """blake2b of the audio bytes plus every setting that changes the output.
+
+    `mode` distinguishes plain / diarized / diarized-with-timestamps output.
+    """
+    import hashlib
+    digest = hashlib.blake2b(digest_size=16)
+    with open(audio_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    # The thread count only changes speed, so it must not split the cache.
+    options = sorted((k, v) for k, v in (engine_options or {}).items()
+                     if v is not None and k != "threads")
+    return f"{digest.hexdigest()}:{engine}:{model_name}:{language}:{mode}:{options!r}"
+
+
+def _output_mode(diarized: bool, include_timestamps: bool) -> str:
+    if not diarized:
+        return "plain"
+    return "diarized-timestamps" if include_timestamps else "diarized"
+
+
+def _open_transcript_cache():
+    import sqlite3
+    os.makedirs(os.path.dirname(_TRANSCRIPT_CACHE_PATH), exist_ok=True)
+    conn = sqlite3.connect(_TRANSCRIPT_CACHE_PATH)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS transcripts "
+        "(key TEXT PRIMARY KEY, txt BLOB, created REAL)"
+    )
+    return conn
+
+
+def _cache_lookup(key: str):
+    """Cached transcript text for `key`, or None on miss/error."""
+    import sqlite3
+    try:
+        conn = _open_transcript_cache()
+        try:
+            row = conn.execute("SELECT txt FROM transcripts WHERE key = ?", (key,)).fetchone()
+        finally:
+            conn.close()
+    except (sqlite3.Error, OSError):
+        return None
+    return row[0].decode("utf-8") if row else None
+
+
+def _cache_store(key: str, transcript: str) -> None:
+    import sqlite3
+    try:
+        conn = _open_transcript_cache()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO transcripts (key, txt, created) VALUES (?, ?, ?)",
+                    (key, transcript.encode("utf-8"), time.time()),
+                )
+        finally:
+            conn.close()
+    except (sqlite3.Error, OSError):
+        pass
+
+
+def _transcribe_to_file(engine, audio_path, model_name, language, txt_path,
+                        engine_options=None, echo=None, log=print):
+    """Transcribe `audio_path` into `txt_path`, one segment per line.
+
+    With an engine that decodes lazily (faster-whisper) each segment goes to
+    disk, and to `echo` if given, as soon as it is decoded; other engines'
+    segments are written when they return. Output goes to `<txt_path>.part`
+    and is renamed into place at the end, so an interrupted run never leaves
+    a truncated transcript that the next run would skip as already done.
+    Other messages (chunked mode's splitting) go through `log`.
+    """
+    part_path = txt_path + ".part"
+    written = 0
+    if echo:
+        echo("\n" + "-" * 40)
+    try:
+        with open(part_path, "w", encoding="utf-8", buffering=1 << 16) as f:
+            def write_segment(seg):
+                nonlocal written
+                line = seg["text"].strip()
+                f.write("\n" + line if written else line)
+                written += 1
+                if echo:
+                    echo(line)
+
+            result = transcribe_audio(
+                engine=engine,
+                audio_path=audio_path,
+                model_name=model_name,
+                language=language,
+                on_segment=write_segment,
+                log=log,
+                **(engine_options or {}),
+            )
+            if not written:
+                for seg in result.get("segments", []):
+                    write_segment(seg)
+        os.replace(part_path, txt_path)
+    except BaseException:
+        if os.path.exists(part_path):
+            os.unlink(part_path)
+        raise
+    if echo:
+        echo("-" * 40 + "\n")
+
+
+def _diarize_segments(file_path: str, segments, diarization_pipeline, language: str,
+                      include_timestamps: bool, log=print) -> str:
+    """Run speaker diarization on `file_path` and label Whisper `segments` with it."""
+    filename = os.path.basename(file_path)
+    log(f"    Running speaker diarization on {filename}...")
+
+    # Pyannote requires WAV format - convert if needed
+    import subprocess
+    import tempfile
+    temp_wav = None
+    audio_for_diarization = file_path
+
+    if os.path.splitext(file_path)[1].lower() in _DIARIZE_CONVERT_SUFFIXES:
+        log(f"    Converting to WAV for diarization...")
+        temp_wav = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
+        temp_wav.close()
+        subprocess.run([
+            'ffmpeg', '-y', '-i', file_path,
+            '-ar', '16000', '-ac', '1',  # 16kHz mono for diarization
+            temp_wav.name
+        ], capture_output=True)
+        audio_for_diarization = temp_wav.name
+
+    try:
+        diarization_result = diarization_pipeline(audio_for_diarization)
+    finally:
+        # Clean up temp file
+        if temp_wav and os.path.exists(temp_wav.name):
+            os.unlink(temp_wav.name)
+
+    # Align Whisper segments with diarization
+    aligned = align_whisper_with_diarization(segments, diarization_result)
+
+    # Merge consecutive same-speaker segments
+    merged = merge_consecutive_speaker_segments(aligned)
+
+    # Format output with language-appropriate speaker labels
+    transcript = format_diarized_transcript(merged, language, include_timestamps)
+
+    log(f"    Speaker diarization complete.")
+    return transcript
+
+
+def _transcribe_one(file_path: str, txt_path: str, model_name: str, language: str,
+                    print_to_screen: bool, engine: str, diarization_pipeline=None,
+                    include_timestamps: bool = False, engine_options: dict = None,
+                    use_cache: bool = True, log=print):
+    """Transcribe one file into `txt_path`; shared by the single-file and folder drivers.
+
+    Reuses a cached transcript when allowed, otherwise runs the engine (and
+    diarization when a pipeline is given). Messages go through `log` so the
+    folder driver can route them around its progress bar.
+
+    Returns (txt_path, elapsed seconds); elapsed is 0 for a cache hit.
+    """
+    filename = os.path.basename(file_path)
+    diarized = diarization_pipeline is not None
+
+    cache_key = None
+    if use_cache:
+        mode = _output_mode(diarized, include_timestamps)
+        cache_key = _transcript_cache_key(file_path, engine, model_name, language, mode, engine_options)
+        transcript = _cache_lookup(cache_key)
+        if transcript is not None:
+            with open(txt_path, "w", encoding="utf-8") as f:
+                f.write(transcript)
+            log(f"♻️   Reused cached transcript for {filename}")
+            log(f"💾  Saved: {txt_path}")
+            if print_to_screen:
+                log("\n" + "-" * 40)
+                log(transcript)
+                log("-" * 40 + "\n")
+            return txt_path, 0
+
+    log(f"⏳  Starting transcription of {filename}")
+
+    start_time = time.time()
+
+    if not diarized:
+        # Plain transcript: stream segments straight to disk (and the console).
+        _transcribe_to_file(engine, file_path, model_name, language, txt_path,
+                            engine_options, echo=log if print_to_screen else None, log=log)
+        elapsed = time.time() - start_time
+        log(f"✓   Finished transcribing {filename} in {elapsed:.1f} seconds")
+        log(f"💾  Saved: {txt_path}")
+        if cache_key:
+            _cache_store(cache_key, _read_text(txt_path))
+        return txt_path, elapsed
+
+    # Transcribe via pluggable engine
+    result = transcribe_audio(
+        engine=engine,
+        audio_path=file_path,
+        model_name=model_name,
+        language=language,
+        word_timestamps=True,
+        log=log,
+        **(engine_options or {}),
+    )
+
+    # Calculate and display elapsed time
+    elapsed = time.time() - start_time
+    log(f"✓   Finished transcribing {filename} in {elapsed:.1f} seconds")
+
+    transcript = _diarize_segments(file_path, result.get("segments", []), diarization_pipeline,
+                                   language, include_timestamps, log)
+
+    # Write out .txt file
+    with open(txt_path, "w", encoding="utf-8") as f:
+        f.write(transcript)
+    log(f"💾  Saved: {txt_path}")
+    if cache_key:
+        _cache_store(cache_key, transcript)
+
+    # Optionally echo to console
+    if print_to_screen:
+        log("\n" + "-" * 40)
+        log(transcript)
+        log("-" * 40 + "\n")
+
+    return txt_path, elapsed
+
+
 def transcribe_single_file(file_path: str, model_name: str, language: str, print_to_screen: bool,
                            diarize: bool = False, diarization_pipeline=None, include_timestamps: bool = False,
-                           output_path: str = None, engine: str = None):
-    """Transcribe a single audio file, optionally with speaker diarization."""
+                           output_path: str = None, engine: str = None, engine_options: dict = None,
+                           use_cache: bool = True):
+    """Transcribe a single audio file, optionally with speaker diarization.
+
+    `engine_options` is forwarded to transcribe_audio() as engine tuning knobs.
+    With `use_cache`, a previously produced transcript of the same audio
+    content and settings is reused instead of re-running the engine.
+    """
     if not os.path.isfile(file_path):
         raise FileNotFoundError(f"File not found: {file_path}")
 
     # Check file extension
-    if not file_path.lower().endswith((".m4a", ".opus")):
+    if not _AUDIO_NAME_RE.search(file_path):
         print(f"Warning: File {file_path} is not a supported audio format (.m4a or .opus). Attempting to transcribe anyway.")
 
     # Get output path
@@ -633,106 +1266,58 @@ def transcribe_single_file(file_path: str, model_name: str, language: str, print
     engine = engine or detect_default_engine()
     print(f"Using engine: {engine} (model: {model_name})")
 
-    print(f"⏳  Starting transcription of {filename}")
-
-    # Create animated progress bar
-    start_time = time.time()
-    stop_progress = threading.Event()
-    progress_thread = threading.Thread(
-        target=show_animated_progress,
-        args=(filename, stop_progress)
+    txt_path, _ = _transcribe_one(
+        file_path, txt_path, model_name, language, print_to_screen, engine,
+        diarization_pipeline=diarization_pipeline if diarize else None,
+        include_timestamps=include_timestamps, engine_options=engine_options,
+        use_cache=use_cache,
     )
-    progress_thread.daemon = True
-    progress_thread.start()
+    return txt_path
 
-    try:
-        # Transcribe via pluggable engine
-        result = transcribe_audio(
-            engine=engine,
-            audio_path=file_path,
-            model_name=model_name,
-            language=language,
-            word_timestamps=diarize,
-        )
+def _write_unified_transcript(unified_file_path: str, filenames, transcripts, durations):
+    """Write all parts with PART headers in a single write call.
 
-        # Stop the progress animation
-        stop_progress.set()
-        progress_thread.join()
+    The body is assembled in memory and encoded once rather than issuing
+    several small writes per transcript; unified files are only a few MB
+    even for large corpora.
 
-        # Calculate and display elapsed time
-        elapsed = time.time() - start_time
-        print(f"✓   Finished transcribing {filename} in {elapsed:.1f} seconds")
-
-        # Process segments - with or without diarization
-        segments = result.get("segments", [])
-
-        if diarize and diarization_pipeline is not None:
-            # Run diarization
-            print(f"    Running speaker diarization on {filename}...")
-
-            # Pyannote requires WAV format - convert if needed
-            import subprocess
-            import tempfile
-            temp_wav = None
-            audio_for_diarization = file_path
-
-            if file_path.lower().endswith(('.m4a', '.opus', '.mp3', '.ogg')):
-                print(f"    Converting to WAV for diarization...")
-                temp_wav = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
-                temp_wav.close()
-                subprocess.run([
-                    'ffmpeg', '-y', '-i', file_path,
-                    '-ar', '16000', '-ac', '1',  # 16kHz mono for diarization
-                    temp_wav.name
-                ], capture_output=True)
-                audio_for_diarization = temp_wav.name
+    The parts come as parallel lists (one entry per part, in output order)
+    rather than a dict per part.
+    """
+    rule = "=" * 60
+    total = len(filenames)
+    parts = []
+    for i, (filename, transcript, duration) in enumerate(zip(filenames, transcripts, durations), 1):
+        duration_info = f" (Transcribed in {duration:.1f} seconds)" if duration > 0 else ""
+        parts.append(f"\n\n{rule}\nPART {i}/{total}: {filename}{duration_info}\n{rule}\n\n")
+        parts.append(transcript)
+        parts.append("\n\n")
+    with open(unified_file_path, "wb") as f:
+        f.write("".join(parts).encode("utf-8"))
 
-            try:
-                diarization_result = diarization_pipeline(audio_for_diarization)
-            finally:
-                # Clean up temp file
-                if temp_wav and os.path.exists(temp_wav.name):
-                    os.unlink(temp_wav.name)
 
-            # Align Whisper segments with diarization
-            aligned = align_whisper_with_diarization(segments, diarization_result)
+def _read_text(path: str) -> str:
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
 
-            # Merge consecutive same-speaker segments
-            merged = merge_consecutive_speaker_segments(aligned)
 
-            # Format output with language-appropriate speaker labels
-            transcript = format_diarized_transcript(merged, language, include_timestamps)
+# Transcript reads are pure I/O wait (open + read, GIL released), so a wide
+# pool hides per-file latency on network/cloud-synced folders.
+_UNIFY_READ_WORKERS = 32
 
-            print(f"    Speaker diarization complete.")
-        else:
-            # Original behavior - just join segment text
-            lines = [seg["text"].strip() for seg in segments]
-            transcript = "\n".join(lines)
-
-        # Write out .txt file
-        with open(txt_path, "w", encoding="utf-8") as f:
-            f.write(transcript)
-        print(f"💾  Saved: {txt_path}")
-        
-        # Optionally echo to console
-        if print_to_screen:
-            print("\n" + "-" * 40)
-            print(transcript)
-            print("-" * 40 + "\n")
-            
-        return txt_path
-    except Exception as e:
-        # Stop the progress animation if there's an error
-        stop_progress.set()
-        if progress_thread.is_alive():
-            progress_thread.join()
-        # Re-raise the exception
-        raise e
 
 def unify_transcripts(folder: str, sort_order: str):
     """Unify existing transcript files without re-transcribing."""
-    # Find all .txt files that might be transcripts
-    txt_files = [f for f in os.listdir(folder) if f.lower().endswith(".txt") and not f.startswith("unified_transcript")]
+    # Find all .txt files that might be transcripts. Every name is kept so the
+    # original-audio lookup below is a set probe instead of a stat per file,
+    # and each transcript keeps the full path scandir already built for it.
+    with os.scandir(folder) as entries:
+        names = set()
+        txt_files = []
+        for e in entries:
+            names.add(e.name)
+            if _TRANSCRIPT_NAME_RE.match(e.name) and e.is_file():
+                txt_files.append((e.name, e.path))
     
     if not txt_files:
         print(f"No transcript files found in {folder}")
@@ -740,65 +1325,52 @@ def unify_transcripts(folder: str, sort_order: str):
         
     # Sort files by base name
     reverse_sort = (sort_order.lower() == "desc")
-    txt_files = sorted(txt_files, key=lambda x: os.path.splitext(x)[0], reverse=reverse_sort)
+    txt_files = sorted(txt_files, key=lambda x: os.path.splitext(x[0])[0], reverse=reverse_sort)
     sort_direction = "descending" if reverse_sort else "ascending"
     print(f"Found {len(txt_files)} transcript files (sorted in {sort_direction} order).")
     
-    # Read all transcript files
-    unified_transcripts = []
-    for filename in tqdm(txt_files, desc="Reading transcripts", unit="file"):
-        file_path = os.path.join(folder, filename)
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                transcript = f.read()
+    # Read all transcript files concurrently; results are consumed in sorted
+    # order so the unified file layout doesn't depend on completion order.
+    filenames, transcripts = [], []
+    with ThreadPoolExecutor(max_workers=min(_UNIFY_READ_WORKERS, len(txt_files))) as pool:
+        futures = [pool.submit(_read_text, path) for _, path in txt_files]
+        for (filename, _), future in tqdm(zip(txt_files, futures), total=len(txt_files),
+                                          desc="Reading transcripts", unit="file"):
+            try:
+                transcript = future.result()
+            except Exception as e:
+                print(f"Error reading {filename}: {str(e)}")
+                continue
                 
-            # Infer original audio filename
+            # Infer original audio filename (for display purposes)
             base_name = os.path.splitext(filename)[0]
-            possible_audio_files = [
-                f"{base_name}.m4a",
-                f"{base_name}.opus"
-            ]
-            
-            # Check if original audio file exists (for display purposes)
             original_file = "Unknown"
-            for audio_file in possible_audio_files:
-                if os.path.exists(os.path.join(folder, audio_file)):
+            for audio_file in (f"{base_name}.m4a", f"{base_name}.opus"):
+                if audio_file in names:
                     original_file = audio_file
                     break
                     
-            unified_transcripts.append({
-                "filename": original_file,
-                "base_name": base_name,
-                "transcript": transcript,
-                "duration": 0  # No transcription time available for existing files
-            })
-            
-        except Exception as e:
-            print(f"Error reading {filename}: {str(e)}")
+            filenames.append(original_file)
+            transcripts.append(transcript)
     
-    if not unified_transcripts:
+    if not filenames:
         print("No valid transcript files found.")
         return
     
     # Create unified transcript file
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
     sort_suffix = "_desc" if sort_order.lower() == "desc" else "_asc"
-    unified_file_path = os.path.join(folder, f"unified_transcript{sort_suffix}_{timestamp}.txt")
+    unified_file_path = os.path.join(folder, f"{_UNIFIED_PREFIX}{sort_suffix}_{timestamp}.txt")
     
-    with open(unified_file_path, "w", encoding="utf-8") as f:
-        for i, item in enumerate(unified_transcripts, 1):
-            f.write(f"\n\n{'=' * 60}\n")
-            f.write(f"PART {i}/{len(unified_transcripts)}: {item['filename']}\n")
-            f.write(f"{'=' * 60}\n\n")
-            f.write(item['transcript'])
-            f.write("\n\n")
+    # No transcription time is available for existing files.
+    _write_unified_transcript(unified_file_path, filenames, transcripts, [0] * len(filenames))
     
     print(f"\n✅ Unified transcript saved to: {unified_file_path}")
     print(f"   Files sorted in {sort_direction} order by filename.")
 
 def transcribe_folder(folder: str, model_name: str, language: str, print_to_screen: bool, unify: str = None,
                       diarize: bool = False, include_timestamps: bool = False, hf_token: str = None,
-                      engine: str = None):
+                      engine: str = None, engine_options: dict = None, use_cache: bool = True):
     # Check if we should only unify existing files
     if unify and not model_name:
         unify_transcripts(folder, unify)
@@ -819,8 +1391,13 @@ def transcribe_folder(folder: str, model_name: str, language: str, print_to_scre
     if not os.path.isdir(folder):
         raise FileNotFoundError(f"Folder not found: {folder}")
 
-    # Get list of audio files
-    audio_files = [f for f in os.listdir(folder) if f.lower().endswith((".m4a", ".opus"))]
+    # Get list of audio files as (name, path); scandir has already joined
+    # each path, so the loop below never rebuilds it.
+    with os.scandir(folder) as entries:
+        audio_files = [
+            (e.name, e.path) for e in entries
+            if _AUDIO_NAME_RE.search(e.name) and e.is_file()
+        ]
     
     if not audio_files:
         print(f"No supported audio files found in {folder}")
@@ -829,23 +1406,20 @@ def transcribe_folder(folder: str, model_name: str, language: str, print_to_scre
     # Sort files by base name (without extension) if we're going to unify
     if unify:
         reverse_sort = (unify.lower() == "desc")
-        audio_files = sorted(audio_files, key=lambda x: os.path.splitext(x)[0], reverse=reverse_sort)
+        audio_files = sorted(audio_files, key=lambda x: os.path.splitext(x[0])[0], reverse=reverse_sort)
         sort_direction = "descending" if reverse_sort else "ascending"
         print(f"Found {len(audio_files)} audio files to transcribe (sorted in {sort_direction} order).")
     else:
         print(f"Found {len(audio_files)} audio files to transcribe.")
     
-    # Create unified transcription file if requested
-    unified_transcripts = []
+    # Parts of the unified transcription file, if requested
+    unified_filenames, unified_transcripts, unified_durations = [], [], []
     
+    txt_suffix = "_diarized.txt" if diarize else ".txt"
+
     # Process each supported audio file with progress bar
-    for filename in tqdm(audio_files, desc="Processing files", unit="file"):
-        file_path = os.path.join(folder, filename)
-        base_name = os.path.splitext(filename)[0]
-        if diarize:
-            txt_path = os.path.join(folder, f"{base_name}_diarized.txt")
-        else:
-            txt_path = os.path.join(folder, f"{base_name}.txt")
+    for filename, file_path in tqdm(audio_files, desc="Processing files", unit="file"):
+        txt_path = os.path.splitext(file_path)[0] + txt_suffix
 
         # Check if transcript already exists
         transcript_exists = os.path.exists(txt_path)
@@ -859,166 +1433,40 @@ def transcribe_folder(folder: str, model_name: str, language: str, print_to_scre
                     with open(txt_path, "r", encoding="utf-8") as f:
                         transcript = f.read()
                     
-                    unified_transcripts.append({
-                        "filename": filename,
-                        "base_name": base_name,
-                        "transcript": transcript,
-                        "duration": 0  # No transcription time available for existing files
-                    })
+                    unified_filenames.append(filename)
+                    unified_transcripts.append(transcript)
+                    unified_durations.append(0)  # No transcription time available for existing files
                 except Exception as e:
                     tqdm.write(f"⚠️  Error reading existing transcript: {str(e)}")
             
             continue
-            
-        tqdm.write(f"⏳  Starting transcription of {filename}")
-        
-        # Create animated progress bar
-        start_time = time.time()
-        stop_progress = threading.Event()
-        progress_thread = threading.Thread(
-            target=show_animated_progress, 
-            args=(filename, stop_progress)
-        )
-        progress_thread.daemon = True
-        progress_thread.start()
-        
-        try:
-            # Transcribe via pluggable engine
-            result = transcribe_audio(
-                engine=engine,
-                audio_path=file_path,
-                model_name=model_name,
-                language=language,
-                word_timestamps=diarize,
-            )
-
-            # Stop the progress animation
-            stop_progress.set()
-            progress_thread.join()
-
-            # Calculate and display elapsed time
-            elapsed = time.time() - start_time
-            tqdm.write(f"✓   Finished transcribing {filename} in {elapsed:.1f} seconds")
-
-            # Process segments - with or without diarization
-            segments = result.get("segments", [])
-
-            if diarize and diarization_pipeline is not None:
-                # Run diarization
-                tqdm.write(f"    Running speaker diarization on {filename}...")
-
-                # Pyannote requires WAV format - convert if needed
-                import subprocess
-                import tempfile
-                temp_wav = None
-                audio_for_diarization = file_path
-
-                if file_path.lower().endswith(('.m4a', '.opus', '.mp3', '.ogg')):
-                    tqdm.write(f"    Converting to WAV for diarization...")
-                    temp_wav = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
-                    temp_wav.close()
-                    subprocess.run([
-                        'ffmpeg', '-y', '-i', file_path,
-                        '-ar', '16000', '-ac', '1',  # 16kHz mono for diarization
-                        temp_wav.name
-                    ], capture_output=True)
-                    audio_for_diarization = temp_wav.name
-
-                try:
-                    diarization_result = diarization_pipeline(audio_for_diarization)
-                finally:
-                    # Clean up temp file
-                    if temp_wav and os.path.exists(temp_wav.name):
-                        os.unlink(temp_wav.name)
-
-                # Align Whisper segments with diarization
-                aligned = align_whisper_with_diarization(segments, diarization_result)
-
-                # Merge consecutive same-speaker segments
-                merged = merge_consecutive_speaker_segments(aligned)
-
-                # Format output with language-appropriate speaker labels
-                transcript = format_diarized_transcript(merged, language, include_timestamps)
 
-                tqdm.write(f"    Speaker diarization complete.")
-            else:
-                # Original behavior - just join segment text
-                lines = [seg["text"].strip() for seg in segments]
-                transcript = "\n".join(lines)
+        _, elapsed = _transcribe_one(
+            file_path, txt_path, model_name, language, print_to_screen, engine,
+            diarization_pipeline=diarization_pipeline,
+            include_timestamps=include_timestamps, engine_options=engine_options,
+            use_cache=use_cache, log=tqdm.write,
+        )
 
-            # Write out .txt file
-            with open(txt_path, "w", encoding="utf-8") as f:
-                f.write(transcript)
-            tqdm.write(f"💾  Saved: {txt_path}")
-            
-            # Add to unified transcripts if requested
-            if unify:
-                unified_transcripts.append({
-                    "filename": filename,
-                    "base_name": base_name,
-                    "transcript": transcript,
-                    "duration": elapsed
-                })
-
-            # Optionally echo to console
-            if print_to_screen:
-                tqdm.write("\n" + "-" * 40)
-                tqdm.write(transcript)
-                tqdm.write("-" * 40 + "\n")
-        except Exception as e:
-            # Stop the progress animation if there's an error
-            stop_progress.set()
-            if progress_thread.is_alive():
-                progress_thread.join()
-            # Re-raise the exception
-            raise e
+        # Add to unified transcripts if requested
+        if unify:
+            unified_filenames.append(filename)
+            unified_transcripts.append(_read_text(txt_path))
+            unified_durations.append(elapsed)
     
     # Create unified transcript file if requested
-    if unify and unified_transcripts:
+    if unify and unified_filenames:
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         sort_suffix = "_desc" if unify.lower() == "desc" else "_asc"
-        unified_file_path = os.path.join(folder, f"unified_transcript{sort_suffix}_{timestamp}.txt")
+        unified_file_path = os.path.join(folder, f"{_UNIFIED_PREFIX}{sort_suffix}_{timestamp}.txt")
         
-        with open(unified_file_path, "w", encoding="utf-8") as f:
-            for i, item in enumerate(unified_transcripts, 1):
-                f.write(f"\n\n{'=' * 60}\n")
-                duration_info = f" (Transcribed in {item['duration']:.1f} seconds)" if item['duration'] > 0 else ""
-                f.write(f"PART {i}/{len(unified_transcripts)}: {item['filename']}{duration_info}\n")
-                f.write(f"{'=' * 60}\n\n")
-                f.write(item['transcript'])
-                f.write("\n\n")
+        _write_unified_transcript(unified_file_path, unified_filenames, unified_transcripts,
+                                  unified_durations)
         
         sort_direction = "descending" if unify.lower() == "desc" else "ascending"
         print(f"\n✅ Unified transcript saved to: {unified_file_path}")
         print(f"   Files sorted in {sort_direction} order by filename.")
 
-def show_animated_progress(filename, stop_event):
-    """Shows an animated progress indicator while Whisper is processing.
-
-    Skipped entirely when stdout isn't a TTY (e.g. Automator-triggered
-    runs piped through tee to a logfile). Otherwise the spinner ticks
-    every 100ms and writes thousands of lines into the log per run.
-    """
-    if not sys.stdout.isatty():
-        # Just block until done; no animation, no log noise.
-        stop_event.wait()
-        return
-
-    spinner = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
-    i = 0
-    start_time = time.time()
-
-    while not stop_event.is_set():
-        elapsed = time.time() - start_time
-        sys.stdout.write(f"\r{spinner[i]} Transcribing {filename}... ({elapsed:.1f}s elapsed)")
-        sys.stdout.flush()
-        time.sleep(0.1)
-        i = (i + 1) % len(spinner)
-
-    # Clear the line when done
-    sys.stdout.write("\r" + " " * 80 + "\r")
-    sys.stdout.flush()
-
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         description="Transcribe audio files with Whisper (single file or directory)"
@@ -1045,7 +1493,86 @@ if __name__ == "__main__":
         choices=list(ENGINES),
         help=("Transcription engine. Default: auto-detect (mlx-whisper on Apple "
               "Silicon if installed, else faster-whisper, else openai-whisper). "
-              "Override via TRANSCRIPTION_ENGINE env var.")
+              "openvino (Intel CPU/GPU/NPU via OpenVINO GenAI) is never "
+              "auto-detected. Override via TRANSCRIPTION_ENGINE env var.")
+    )
+    parser.add_argument(
+        "--compute-type",
+        default="auto",
+        choices=list(COMPUTE_TYPES),
+        help=("faster-whisper quantization (CTranslate2 compute type). Default: "
+              "auto, which picks the fastest type the CPU supports. int8 is "
+              "usually fastest on AVX2/NEON CPUs. Ignored by other engines.")
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help=(f"faster-whisper only: decode files longer than "
+              f"{_BATCHED_MIN_SECONDS}s with the batched inference pipeline, "
+              "packing this many 30s windows per forward pass (e.g. 16). "
+              "Default: off (sequential decoding).")
+    )
+    parser.add_argument(
+        "--chunk-seconds",
+        type=int,
+        default=None,
+        help=("Split files longer than twice this many seconds into chunks and "
+              "transcribe them in parallel processes (one model per process, so "
+              "memory scales with CPU count). Context is lost at chunk "
+              "boundaries. Default: off.")
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=("Don't reuse or record transcripts in the content-addressed cache "
+              "(~/.cache/transcribe/index.sqlite)")
+    )
+    parser.add_argument(
+        "--device",
+        default="auto",
+        choices=list(DEVICES),
+        help=("Inference device for openai-whisper / faster-whisper / openvino. "
+              "Default: auto (CUDA when available, else CPU; FP16 is used "
+              "off-CPU; OpenVINO's AUTO plugin for openvino). mps is "
+              "openai-whisper only; gpu/npu are openvino only. Ignored by "
+              "mlx-whisper.")
+    )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=None,
+        help=("CPU threads for inference (OMP/MKL/OpenBLAS, torch, "
+              "CTranslate2). Default: number of physical cores, unless "
+              "OMP_NUM_THREADS is already set.")
+    )
+    parser.add_argument(
+        "--beam-size",
+        type=int,
+        default=None,
+        help=("Beam width for openai-whisper / faster-whisper decoding "
+              "(mlx-whisper is always greedy). Default: 1 (greedy), or 5 "
+              "with --quality.")
+    )
+    parser.add_argument(
+        "--temperature",
+        type=float,
+        default=None,
+        help=("Sampling temperature. Default: 0 with no fallback, or the "
+              "0,0.2,...,1.0 fallback schedule with --quality.")
+    )
+    parser.add_argument(
+        "--no-context",
+        action="store_true",
+        help=("Don't condition each window on the previous window's text. "
+              "Faster and avoids repetition loops, but less consistent "
+              "spelling and punctuation across windows.")
+    )
+    parser.add_argument(
+        "--quality",
+        action="store_true",
+        help=("Slower, more robust decoding: beam size 5 with temperature "
+              "fallback. --beam-size / --temperature still override.")
     )
     parser.add_argument(
         "--lang", "-l",
@@ -1125,6 +1652,13 @@ if __name__ == "__main__":
             f"Valid: {', '.join(ENGINES)}"
         )
 
+    if args.threads is not None and args.threads < 1:
+        parser.error("--threads must be a positive integer.")
+    if args.beam_size is not None and args.beam_size < 1:
+        parser.error("--beam-size must be a positive integer.")
+    # Before any engine import, so torch / CTranslate2 size their pools from it.
+    threads = _configure_threads(args.threads)
+
     # Short-circuit: language detection mode. Runs on first --detect-seconds
     # of audio, prints the ISO code, and exits. Used by transcribe_one.sh as
     # a gate before kicking off the (much more expensive) full pipeline.
@@ -1151,6 +1685,20 @@ if __name__ == "__main__":
         print(lang if lang else "und")
         sys.exit(0)
 
+    engine_options = {
+        "compute_type": args.compute_type,
+        "batch_size": args.batch_size,
+        "device": args.device,
+        "threads": threads,
+        "chunk_seconds": args.chunk_seconds,
+        # Greedy, single-temperature decoding by default: one decoder pass per
+        # window instead of beam_size x fallbacks. --quality restores beams.
+        "beam_size": args.beam_size or (5 if args.quality else 1),
+        "temperature": (args.temperature if args.temperature is not None
+                        else _QUALITY_TEMPERATURES if args.quality else 0.0),
+        "condition_on_previous_text": False if args.no_context else None,
+    }
+
     # Determine if path is a file or directory
     is_file = os.path.isfile(args.path)
     is_dir = os.path.isdir(args.path)
@@ -1194,6 +1742,8 @@ if __name__ == "__main__":
             include_timestamps=args.timestamps,
             output_path=args.output,
             engine=args.engine,
+            engine_options=engine_options,
+            use_cache=not args.no_cache,
         )
     else:  # Directory
         # Directory mode: if --model omitted, args.model is None and the
@@ -1211,4 +1761,6 @@ if __name__ == "__main__":
             include_timestamps=args.timestamps,
             hf_token=getattr(args, 'hf_token', None),
             engine=args.engine,
+            engine_options=engine_options,
+            use_cache=not args.no_cache,
         )
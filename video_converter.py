@@ -23,16 +23,96 @@ Usage:
 
     # Force re-conversion of existing files:
     python video_converter.py /path/to/videos_folder --force
+
+    # Re-encode even when the source audio could be copied as-is:
+    python video_converter.py /path/to/video.mp4 --force-reencode
+
+    # Skip ffmpeg's default 5 MB / 5 s stream analysis on many small files:
+    python video_converter.py /path/to/videos_folder --fast-probe
+
+    # Extract 8 files per ffmpeg process (amortizes process startup):
+    python video_converter.py /path/to/videos_folder --batch-size 8
+
+    # Give up on any file whose ffmpeg run takes longer than 10 minutes:
+    python video_converter.py /path/to/videos_folder --timeout 600
+
+    # Record conversions so a changed source is redone on the next run:
+    python video_converter.py /path/to/videos_folder --manifest
+
+    # List what would be converted, without running ffmpeg:
+    python video_converter.py /path/to/videos_folder --dry-run
+
+    # Convert in-process with PyAV (pip install av) instead of spawning ffmpeg:
+    python video_converter.py /path/to/videos_folder --backend av
+
+    # Convert at most 2 files at a time:
+    python video_converter.py /path/to/videos_folder --jobs 2
 """
 import os
 import sys
 import argparse
+import functools
+import json
+import shutil
 import subprocess
-from tqdm import tqdm
+import tempfile
+import threading
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from enum import Enum
 import time
 
 # Supported video file extensions
 VIDEO_EXTENSIONS = ('.mp4', '.mov', '.avi', '.mkv', '.webm', '.flv', '.wmv', '.m4v', '.mpg', '.mpeg')
+# Set form for O(1) lookup of a single lowercased suffix
+_EXT_SET = frozenset(VIDEO_EXTENSIONS)
+
+
+def has_video_extension(name):
+    """True if `name` ends in a known video extension (any case)."""
+    # Lowercase only the short suffix, not the whole path
+    return os.path.splitext(name)[1].lower() in _EXT_SET
+
+
+# Resolved executable paths by tool name (None: not on PATH). Each process
+# walks PATH at most once per tool; pool workers are seeded with the
+# parent's by _init_worker.
+_binaries = {}
+
+# Chosen ffmpeg encoder by output format, seeded the same way so workers
+# don't each run their own `ffmpeg -encoders` probe.
+_codecs = {}
+
+
+def binary(name):
+    """Return the path to run for `name` ("ffmpeg", "ffprobe").
+
+    Falls back to the bare name when it isn't on PATH, so a missing tool
+    still surfaces as FileNotFoundError where it's run.
+    """
+    if name not in _binaries:
+        _binaries[name] = shutil.which(name)
+    return _binaries[name] or name
+
+
+def binary_found(name):
+    """True if `name` is on PATH (its path may still be relative)."""
+    binary(name)
+    return _binaries[name] is not None
+
+
+def _init_worker(binaries, codecs):
+    """ProcessPoolExecutor initializer: reuse the parent's resolved paths
+    and encoders."""
+    _binaries.update(binaries)
+    _codecs.update(codecs)
+
+
+class Result(Enum):
+    """Outcome of converting one file."""
+    CONVERTED = "converted"
+    SKIPPED = "skipped"
+    FAILED = "failed"
 
 
 def looks_like_media(path):
@@ -53,7 +133,7 @@ def looks_like_media(path):
     try:
         result = subprocess.run(
             [
-                "ffprobe", "-v", "error",
+                binary("ffprobe"), "-v", "error",
                 "-show_entries", "stream=codec_type",
                 "-of", "default=nw=1:nk=1",
                 path,
@@ -76,17 +156,216 @@ def looks_like_media(path):
     streams = {line.strip() for line in result.stdout.splitlines() if line.strip()}
     return bool(streams & {"audio", "video"})
 
-def get_audio_codec(output_format):
-    """Get the appropriate audio codec for the output format."""
+# Source audio codecs each output container can take as-is. When the input's
+# first audio stream is one of these, the conversion is a remux (-c:a copy):
+# disk-speed and lossless instead of a CPU-bound, lossy re-encode.
+COPY_COMPATIBLE_CODECS = {
+    'm4a': {'aac'},
+    'mp3': {'mp3'},
+    'opus': {'opus'},
+    # Only the exact PCM the wav output is written as; other sample
+    # formats are converted to it so the output stays 16-bit.
+    'wav': {'pcm_s16le'},
+}
+
+# Per-process cache of ffprobe results, keyed by input path, so a file
+# that is retried isn't probed again.
+_probe_cache = {}
+
+
+def probe_media(video_path):
+    """Return (first audio stream's codec name, duration in seconds).
+
+    Both come from a single ffprobe run; either is None if unknown.
+    """
+    if video_path in _probe_cache:
+        return _probe_cache[video_path]
+    info = {}
+    try:
+        result = subprocess.run(
+            [
+                binary("ffprobe"), "-v", "error",
+                "-select_streams", "a:0",
+                "-show_entries", "stream=codec_name:format=duration",
+                "-of", "default=nw=1",
+                video_path,
+            ],
+            capture_output=True,
+            text=True,
+            timeout=15,
+        )
+        if result.returncode == 0:
+            for line in result.stdout.splitlines():
+                key, _, value = line.strip().partition("=")
+                info.setdefault(key, value)
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        pass
+    try:
+        duration = float(info["duration"])
+    except (KeyError, ValueError):  # Missing or "N/A"
+        duration = None
+    _probe_cache[video_path] = (info.get("codec_name") or None, duration)
+    return _probe_cache[video_path]
+
+
+def probe_audio_codec(video_path):
+    """Return the codec name of the first audio stream, or None if unknown."""
+    return probe_media(video_path)[0]
+
+# --hwaccel choices. "none" (default) leaves decoding to ffmpeg's software
+# path; "auto" lets ffmpeg pick whatever the platform offers.
+HWACCELS = ("none", "auto", "cuda", "videotoolbox", "qsv", "vaapi")
+
+
+@functools.lru_cache(maxsize=None)
+def available_hwaccels():
+    """Hardware decode methods this ffmpeg build supports (probed once)."""
+    try:
+        result = subprocess.run(
+            [binary("ffmpeg"), "-hide_banner", "-hwaccels"],
+            capture_output=True,
+            text=True,
+            timeout=15,
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return frozenset()
+    # Output is a "Hardware acceleration methods:" header, then one per line
+    return frozenset(line.strip() for line in result.stdout.splitlines()[1:] if line.strip())
+
+
+def resolve_hwaccel(requested):
+    """Return the -hwaccel value to use for `requested`, or None for none.
+
+    A specific method this ffmpeg build lacks falls back to software
+    decoding with a warning instead of failing every conversion.
+    """
+    if not requested or requested == "none":
+        return None
+    if requested != "auto" and requested not in available_hwaccels():
+        print(f"⚠️  ffmpeg has no {requested} hwaccel; decoding in software", file=sys.stderr)
+        return None
+    return requested
+
+# Global options for every conversion: errors only on stderr (no banner or
+# per-stream info to buffer), and never read stdin, which a parallel run
+# started from a terminal would otherwise share.
+QUIET_ARGS = ["-hide_banner", "-loglevel", "error", "-nostdin"]
+
+# Lines of ffmpeg's stderr kept for a failure message
+STDERR_TAIL_LINES = 20
+
+# --fast-probe input options. ffmpeg's defaults (5 MB / 5 s of analysis)
+# are fixed startup cost on every file; 1 MB / 1 s is plenty to find the
+# first audio stream of ordinary recordings.
+FAST_PROBE_ARGS = ["-probesize", "1000000", "-analyzeduration", "1000000"]
+
+# Encoders to prefer over the default when this ffmpeg build has them, best
+# first: Fraunhofer FDK AAC, then the OS encoders (AudioToolbox on macOS,
+# which runs on the media engine on Apple Silicon; MediaFoundation on
+# Windows), all faster than ffmpeg's native aac at equal quality.
+PREFERRED_ENCODERS = {
+    'm4a': ('libfdk_aac', 'aac_at', 'aac_mf'),
+    'mp3': ('libmp3lame', 'mp3_mf'),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def available_encoders():
+    """Audio encoders this ffmpeg build supports (probed once)."""
+    try:
+        result = subprocess.run(
+            [binary("ffmpeg"), "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+            timeout=15,
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return frozenset()
+    # A flags legend ending in a " ------" rule, then " A....D name  description"
+    lines = result.stdout.splitlines()
+    start = next((i + 1 for i, line in enumerate(lines) if line.strip() == "------"), len(lines))
+    encoders = set()
+    for line in lines[start:]:
+        fields = line.split()
+        if len(fields) >= 2 and fields[0].startswith("A"):
+            encoders.add(fields[1])
+    return frozenset(encoders)
+
+def get_audio_codec(output_format, encoders=None):
+    """Get the best available audio codec for the output format.
+
+    `encoders` is the set of encoder names to choose from (default: the
+    ones the ffmpeg binary reports).
+    """
     codec_map = {
         'm4a': 'aac',
         'mp3': 'libmp3lame',
         'opus': 'libopus',
         'wav': 'pcm_s16le'
     }
+    preferred = PREFERRED_ENCODERS.get(output_format)
+    if preferred:
+        if encoders is None:
+            encoders = available_encoders()
+        for name in preferred:
+            if name in encoders:
+                return name
     return codec_map.get(output_format, 'aac')
 
-def convert_video_to_audio(video_path, output_dir, output_format, bitrate, force=False):
+def audio_codec(output_format):
+    """get_audio_codec for ffmpeg runs, resolved once per output format."""
+    codec = _codecs.get(output_format)
+    if codec is None:
+        codec = _codecs[output_format] = get_audio_codec(output_format)
+    return codec
+
+def _command_parts(threads, hwaccel, fast_probe):
+    """File-independent ends of a conversion's ffmpeg command.
+
+    Every file in a run shares the same options, so main() builds these
+    once and hands them to each conversion. Returns tuples
+    (input_args, output_args); a command is input_args + [-i, path, -vn]
+    + COPY_ARGS or _encode_args(...) + output_args + [output_path].
+    """
+    input_args = [
+        binary("ffmpeg"),
+        *QUIET_ARGS,
+        "-progress", "pipe:1",  # key=value progress blocks on stdout
+        "-nostats",
+    ]
+    if hwaccel:
+        input_args.extend(["-hwaccel", hwaccel])  # Input option: must precede -i
+    if fast_probe:
+        input_args.extend(FAST_PROBE_ARGS)
+
+    output_args = ["-y"]  # Overwrite output files without asking
+    # Cap ffmpeg's threads so parallel conversions share the cores instead
+    # of each one sizing its pool to the whole machine
+    if threads:
+        output_args.extend(["-threads", str(threads)])
+
+    return tuple(input_args), tuple(output_args)
+
+# Copy exactly the stream that was probed; bitrate doesn't apply
+COPY_ARGS = ("-map", "0:a:0", "-c:a", "copy")
+
+def _encode_args(output_format, bitrate, fast_probe):
+    """Audio options for a file that has to be re-encoded."""
+    encode_args = []
+    if fast_probe:
+        # Take the first audio stream outright rather than letting
+        # ffmpeg rank every stream it found
+        encode_args.extend(["-map", "0:a:0?"])
+    encode_args.extend(["-acodec", audio_codec(output_format)])
+    # Add bitrate for formats that support it (not WAV)
+    if output_format != 'wav':
+        encode_args.extend(["-b:a", bitrate])
+    return encode_args
+
+def convert_video_to_audio(video_path, output_dir, output_format, bitrate, force=False,
+                           threads=None, force_reencode=False, hwaccel=None,
+                           fast_probe=False, timeout=None, progress=False, log=print,
+                           command_parts=None):
     """
     Convert a video file to audio-only format.
 
@@ -96,13 +375,19 @@ def convert_video_to_audio(video_path, output_dir, output_format, bitrate, force
         output_format: Output audio format (m4a, mp3, opus, wav)
         bitrate: Audio bitrate (e.g., '192k', '320k')
         force: Force re-conversion even if output file exists
+        threads: ffmpeg thread count for this conversion (default: ffmpeg's own)
+        force_reencode: Re-encode even when the source audio could be stream-copied
+        hwaccel: ffmpeg -hwaccel method for decoding the input (None for software)
+        fast_probe: Shrink ffmpeg's input analysis and map the first audio stream directly
+        timeout: Kill ffmpeg after this many seconds (default: no limit)
+        progress: Show a per-file tqdm bar following ffmpeg's position (terminals only)
+        log: Where per-file messages go (default: print)
+        command_parts: _command_parts(threads, hwaccel, fast_probe), when the
+            caller has already built them for its run (default: built here)
 
     Returns:
-        True if conversion was successful, False otherwise
+        Result.CONVERTED, Result.SKIPPED (output already exists) or Result.FAILED
     """
-    # Create output directory if it doesn't exist
-    os.makedirs(output_dir, exist_ok=True)
-
     # Get the base filename without extension
     base_name = os.path.splitext(os.path.basename(video_path))[0]
 
@@ -112,53 +397,370 @@ def convert_video_to_audio(video_path, output_dir, output_format, bitrate, force
 
     # Check if output already exists
     if os.path.exists(output_path) and not force:
-        print(f"⏭️  Skipping {base_name} (audio already exists at {output_path})")
-        return True
+        log(f"⏭️  Skipping {base_name} (audio already exists at {output_path})")
+        return Result.SKIPPED
 
-    # Get audio codec
-    audio_codec = get_audio_codec(output_format)
+    # Create output directory if it doesn't exist (skips never need it)
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Stream-copy when the source audio already fits the output container
+    copy_audio = (not force_reencode
+                  and probe_audio_codec(video_path) in COPY_COMPATIBLE_CODECS.get(output_format, ()))
 
-    # Build ffmpeg command
+    # Build ffmpeg command around the file-independent parts
+    input_args, output_args = command_parts or _command_parts(threads, hwaccel, fast_probe)
     cmd = [
-        "ffmpeg",
+        *input_args,
         "-i", video_path,
         "-vn",  # No video
-        "-acodec", audio_codec,
-        "-y",  # Overwrite output files without asking
+        *(COPY_ARGS if copy_audio else _encode_args(output_format, bitrate, fast_probe)),
+        *output_args,
+        output_path,
     ]
 
-    # Add bitrate for formats that support it (not WAV)
-    if output_format != 'wav':
-        cmd.extend(["-b:a", bitrate])
+    show_bar = progress and sys.stderr.isatty()
+    duration = probe_media(video_path)[1] if show_bar else None
+
+    # Run ffmpeg. stderr goes to a temp file so a chatty error can't fill a
+    # pipe nobody is reading while we consume the progress stream.
+    try:
+        with tempfile.TemporaryFile(mode="w+") as errors:
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=errors, text=True)
+            # The progress loop blocks on ffmpeg's output, so a hung run is
+            # killed from a timer rather than by a wait() timeout.
+            timed_out = threading.Event()
+
+            def expire():
+                # Flagged before the kill: this thread can wake on the closed
+                # pipe and check the flag before the timer's own run() ends
+                timed_out.set()
+                proc.kill()
+
+            watchdog = threading.Timer(timeout, expire) if timeout else None
+            if watchdog:
+                watchdog.start()
+            try:
+                if show_bar:
+                    from tqdm import tqdm  # Deferred: most runs never draw this bar
+                    with tqdm(total=round(duration, 1) if duration else None, unit="s",
+                              desc=base_name, leave=False) as bar:
+                        for line in proc.stdout:
+                            key, _, value = line.strip().partition("=")
+                            # Despite the name, out_time_ms is in microseconds.
+                            if key != "out_time_ms" or not value.lstrip("-").isdigit():
+                                continue
+                            position = int(value) / 1_000_000
+                            if duration:
+                                position = min(position, duration)
+                            bar.update(max(0.0, round(position - bar.n, 1)))
+                else:
+                    # Still drain the pipe so ffmpeg never blocks writing to it
+                    for _ in proc.stdout:
+                        pass
+                returncode = proc.wait()
+            except BaseException:
+                proc.terminate()
+                proc.wait()
+                raise
+            finally:
+                if watchdog:
+                    watchdog.cancel()
+
+            if returncode == 0:
+                # Get file size for reporting
+                size_mb = os.path.getsize(output_path) / (1024 * 1024)
+                mode = ", stream copy" if copy_audio else ""
+                log(f"✅ {base_name} → {output_filename} ({size_mb:.1f} MB{mode})")
+                return Result.CONVERTED
+            if timed_out.is_set():
+                log(f"❌ Error converting {base_name}: ffmpeg timed out after {timeout:g}s")
+            else:
+                # Only the tail: the last lines name the actual failure
+                errors.seek(0)
+                tail = "".join(deque(errors, maxlen=STDERR_TAIL_LINES)).strip()
+                log(f"❌ Error converting {base_name}: {tail}")
+            return Result.FAILED
+
+    except FileNotFoundError:
+        log("❌ Error: ffmpeg not found. Please install ffmpeg first.")
+        log("   macOS: brew install ffmpeg")
+        log("   Ubuntu/Debian: apt-get install ffmpeg")
+        return Result.FAILED
+    except Exception as e:
+        log(f"❌ Error converting {base_name}: {str(e)}")
+        return Result.FAILED
+
+def convert_batch(video_paths, output_dir, output_format, bitrate, force=False,
+                  threads=None, force_reencode=False, hwaccel=None, fast_probe=False,
+                  timeout=None, log=print):
+    """
+    Convert several video files with a single ffmpeg process.
+
+    Each video becomes one input with its own mapped output, so process
+    startup and library loading are paid once per batch instead of once
+    per file. If the batch fails, its files are retried one at a time so
+    one bad input doesn't fail the rest and the error names the culprit.
 
-    cmd.append(output_path)
+    Takes the same options as convert_video_to_audio; `timeout` is per
+    file, so the batch as a whole gets timeout × files.
+
+    Returns:
+        List of Result values, one per entry in video_paths
+    """
+    results = [Result.SKIPPED] * len(video_paths)
+    pending = []  # (index, video_path, base_name, output_path, copy_audio)
+    for index, video_path in enumerate(video_paths):
+        base_name = os.path.splitext(os.path.basename(video_path))[0]
+        output_path = os.path.join(output_dir, f"{base_name}.{output_format}")
+        if os.path.exists(output_path) and not force:
+            log(f"⏭️  Skipping {base_name} (audio already exists at {output_path})")
+            continue
+        copy_audio = (not force_reencode
+                      and probe_audio_codec(video_path) in COPY_COMPATIBLE_CODECS.get(output_format, ()))
+        pending.append((index, video_path, base_name, output_path, copy_audio))
+
+    if not pending:
+        return results
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Build ffmpeg command: all inputs first, then one output per input
+    cmd = [binary("ffmpeg"), *QUIET_ARGS, "-y"]
+    for _, video_path, _, _, _ in pending:
+        if hwaccel:
+            cmd.extend(["-hwaccel", hwaccel])
+        if fast_probe:
+            cmd.extend(FAST_PROBE_ARGS)
+        cmd.extend(["-i", video_path])
+
+    for n, (_, _, _, output_path, copy_audio) in enumerate(pending):
+        if copy_audio:
+            cmd.extend(["-map", f"{n}:a:0", "-c:a", "copy"])
+        else:
+            cmd.extend(["-map", f"{n}:a:0?", "-acodec", audio_codec(output_format)])
+            if output_format != 'wav':
+                cmd.extend(["-b:a", bitrate])
+        if threads:
+            cmd.extend(["-threads", str(threads)])
+        cmd.extend(["-vn", output_path])
 
-    # Run ffmpeg
     try:
+        # stderr is discarded: a failed batch is retried file by file,
+        # and those runs report their own errors.
         result = subprocess.run(
             cmd,
             stdout=subprocess.DEVNULL,
-            stderr=subprocess.PIPE,
-            text=True
+            stderr=subprocess.DEVNULL,
+            timeout=timeout * len(pending) if timeout else None
         )
+    except subprocess.TimeoutExpired:
+        result = None
+    except FileNotFoundError:
+        log("❌ Error: ffmpeg not found. Please install ffmpeg first.")
+        log("   macOS: brew install ffmpeg")
+        log("   Ubuntu/Debian: apt-get install ffmpeg")
+        for index, _, _, _, _ in pending:
+            results[index] = Result.FAILED
+        return results
 
-        if result.returncode == 0:
-            # Get file size for reporting
+    if result is not None and result.returncode == 0:
+        for index, _, base_name, output_path, copy_audio in pending:
+            results[index] = Result.CONVERTED
             size_mb = os.path.getsize(output_path) / (1024 * 1024)
-            print(f"✅ {base_name} → {output_filename} ({size_mb:.1f} MB)")
-            return True
-        else:
-            print(f"❌ Error converting {base_name}: {result.stderr}")
-            return False
+            mode = ", stream copy" if copy_audio else ""
+            log(f"✅ {base_name} → {os.path.basename(output_path)} ({size_mb:.1f} MB{mode})")
+        return results
 
-    except FileNotFoundError:
-        print("❌ Error: ffmpeg not found. Please install ffmpeg first.")
-        print("   macOS: brew install ffmpeg")
-        print("   Ubuntu/Debian: apt-get install ffmpeg")
-        return False
+    # ffmpeg aborts the whole batch on the first bad input. Redo each file
+    # on its own (force: the failed run may have left partial outputs).
+    log(f"⚠️  Batch of {len(pending)} failed; retrying files one at a time")
+    command_parts = _command_parts(threads, hwaccel, fast_probe)
+    for index, video_path, _, _, _ in pending:
+        results[index] = convert_video_to_audio(
+            video_path, output_dir, output_format, bitrate, True,
+            threads, force_reencode, hwaccel, fast_probe, timeout, log=log,
+            command_parts=command_parts)
+    return results
+
+def _collect_messages(convert, *args, **kwargs):
+    """Run `convert` in a pool worker and return (result, messages).
+
+    Parallel workers printing directly would interleave with each other
+    and with main()'s progress bar; main() writes the messages instead.
+    """
+    messages = []
+    result = convert(*args, log=messages.append, **kwargs)
+    return result, messages
+
+def batch_groups(video_paths, batch_size):
+    """
+    Split video_paths into groups of at most batch_size files whose
+    combined ffmpeg command line stays well under the OS argument limit.
+    """
+    try:
+        arg_max = os.sysconf("SC_ARG_MAX")
+    except (AttributeError, ValueError, OSError):
+        arg_max = 32767  # Windows CreateProcess command-line limit
+    # Half the limit leaves room for the environment, which shares it
+    budget = arg_max // 2
+
+    groups = []
+    group = []
+    used = 0
+    for video_path in video_paths:
+        # Each file appears as an input and (roughly) as an output, plus
+        # its per-input/per-output options
+        cost = 2 * len(os.fsencode(video_path)) + 128
+        if group and (len(group) >= batch_size or used + cost > budget):
+            groups.append(group)
+            group = []
+            used = 0
+        group.append(video_path)
+        used += cost
+    if group:
+        groups.append(group)
+    return groups
+
+def parse_bitrate(bitrate):
+    """'192k' -> 192000 bits/s; a plain number is already bits/s."""
+    value = bitrate.strip().lower()
+    scale = {"k": 1000, "m": 1000000}.get(value[-1:])
+    if scale:
+        return int(float(value[:-1]) * scale)
+    return int(float(value))
+
+def _import_av():
+    try:
+        import av
+    except ImportError as e:
+        raise RuntimeError(
+            "PyAV is not installed. Run: pip install av\n"
+            "Or drop --backend av to use the ffmpeg command-line tool."
+        ) from e
+    return av
+
+def convert_with_av(video_path, output_dir, output_format, bitrate, force=False,
+                    force_reencode=False, log=print):
+    """
+    Convert a video file to audio in-process with PyAV (libav*).
+
+    Same outcome as convert_video_to_audio without spawning ffmpeg: no
+    fork/exec or library loading per file, and a pool worker keeps libav
+    initialized across all the files it converts. Compatible audio is
+    remuxed packet by packet; anything else is decoded and re-encoded.
+
+    Returns:
+        Result.CONVERTED, Result.SKIPPED (output already exists) or Result.FAILED
+    """
+    av = _import_av()
+
+    base_name = os.path.splitext(os.path.basename(video_path))[0]
+    output_filename = f"{base_name}.{output_format}"
+    output_path = os.path.join(output_dir, output_filename)
+
+    if os.path.exists(output_path) and not force:
+        log(f"⏭️  Skipping {base_name} (audio already exists at {output_path})")
+        return Result.SKIPPED
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    try:
+        with av.open(video_path) as src:
+            if not src.streams.audio:
+                log(f"❌ Error converting {base_name}: no audio stream")
+                return Result.FAILED
+            in_stream = src.streams.audio[0]
+            # Compare codec ids: PyAV names the decoder ("mp3float"), not the codec
+            compatible = set()
+            for name in COPY_COMPATIBLE_CODECS.get(output_format, ()):
+                try:
+                    compatible.add(av.Codec(name).id)
+                except ValueError:  # Not in this libav build
+                    pass
+            copy_audio = not force_reencode and in_stream.codec_context.codec.id in compatible
+
+            with av.open(output_path, mode="w") as dst:
+                if copy_audio:
+                    # PyAV 14 renamed add_stream(template=...)
+                    if hasattr(dst, "add_stream_from_template"):
+                        out_stream = dst.add_stream_from_template(in_stream)
+                    else:
+                        out_stream = dst.add_stream(template=in_stream)
+                    for packet in src.demux(in_stream):
+                        if packet.dts is None:  # Demuxer flush packet
+                            continue
+                        packet.stream = out_stream
+                        dst.mux(packet)
+                else:
+                    # codecs_available lists decoders too; keep what can encode
+                    encoders = set()
+                    for name in PREFERRED_ENCODERS.get(output_format, ()):
+                        try:
+                            av.Codec(name, "w")
+                        except ValueError:  # Decoder only, or not in this build
+                            continue
+                        encoders.add(name)
+                    encoder = get_audio_codec(output_format, encoders)
+                    # Opus only encodes at 48 kHz; everything else keeps the source rate
+                    rate = 48000 if output_format == "opus" else in_stream.codec_context.sample_rate
+                    out_stream = dst.add_stream(encoder, rate=rate)
+                    out_stream.codec_context.layout = in_stream.codec_context.layout
+                    if output_format != 'wav':
+                        out_stream.codec_context.bit_rate = parse_bitrate(bitrate)
+                    # The encoder resamples each frame to its own format
+                    for frame in src.decode(in_stream):
+                        frame.pts = None
+                        for packet in out_stream.encode(frame):
+                            dst.mux(packet)
+                    for packet in out_stream.encode(None):
+                        dst.mux(packet)
     except Exception as e:
-        print(f"❌ Error converting {base_name}: {str(e)}")
-        return False
+        log(f"❌ Error converting {base_name}: {str(e)}")
+        if os.path.exists(output_path):
+            os.remove(output_path)
+        return Result.FAILED
+
+    size_mb = os.path.getsize(output_path) / (1024 * 1024)
+    mode = ", stream copy" if copy_audio else ""
+    log(f"✅ {base_name} → {output_filename} ({size_mb:.1f} MB{mode})")
+    return Result.CONVERTED
+
+# --manifest record, kept in the output folder: output filename -> the source
+# it was made from, with that source's mtime and size at the time.
+MANIFEST_NAME = ".video_converter_manifest.json"
+
+
+def audio_filename(video_path, output_format):
+    """Filename the converted audio of `video_path` gets."""
+    return f"{os.path.splitext(os.path.basename(video_path))[0]}.{output_format}"
+
+def source_fingerprint(video_path):
+    """Manifest entry describing the current state of `video_path`."""
+    st = os.stat(video_path)
+    return {
+        "source": os.path.abspath(video_path),
+        "mtime_ns": st.st_mtime_ns,
+        "size": st.st_size,
+    }
+
+def load_manifest(path):
+    """Read a manifest, or return an empty one if missing or unreadable."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"⚠️  Ignoring unreadable manifest {path}: {e}", file=sys.stderr)
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+def save_manifest(path, manifest):
+    """Write a manifest atomically, so an interrupted run can't truncate it."""
+    part_path = path + ".part"
+    with open(part_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(part_path, path)
 
 def get_video_files(path, specific_file=None):
     """
@@ -175,7 +777,7 @@ def get_video_files(path, specific_file=None):
 
     # If path is a file
     if os.path.isfile(path):
-        if path.lower().endswith(VIDEO_EXTENSIONS) or looks_like_media(path):
+        if has_video_extension(path) or looks_like_media(path):
             video_files.append(path)
         else:
             print(f"Error: {path} is not a recognizable media file")
@@ -188,7 +790,7 @@ def get_video_files(path, specific_file=None):
             # Process specific file in directory
             file_path = os.path.join(path, specific_file)
             if os.path.isfile(file_path):
-                if file_path.lower().endswith(VIDEO_EXTENSIONS) or looks_like_media(file_path):
+                if has_video_extension(file_path) or looks_like_media(file_path):
                     video_files.append(file_path)
                 else:
                     print(f"Error: {specific_file} is not a recognizable media file")
@@ -199,9 +801,16 @@ def get_video_files(path, specific_file=None):
             # extension-based to avoid ffprobe-ing every random file in
             # the folder; the extensionless-recording case only matters
             # for the Folder Action path, which always passes a single file.
-            for filename in sorted(os.listdir(path)):
-                if filename.lower().endswith(VIDEO_EXTENSIONS):
-                    video_files.append(os.path.join(path, filename))
+            # scandir's is_file() answers from the directory entry itself
+            # (only symlinks need a stat), and the suffix test runs first
+            # so non-video entries cost nothing beyond the name check.
+            with os.scandir(path) as entries:
+                names = [
+                    entry.name for entry in entries
+                    if has_video_extension(entry.name)
+                    and entry.is_file()
+                ]
+            video_files = [os.path.join(path, name) for name in sorted(names)]
 
         return video_files
 
@@ -220,6 +829,13 @@ Examples:
   %(prog)s videos/ --output audio/            # Save to custom directory
   %(prog)s video.mp4 --bitrate 320k           # Higher quality audio
   %(prog)s videos/ --force                    # Re-convert existing files
+  %(prog)s videos/ --fast-probe               # Faster startup on many small files
+  %(prog)s videos/ --batch-size 8             # 8 files per ffmpeg process
+  %(prog)s videos/ --timeout 600              # Kill ffmpeg runs stuck past 10 min
+  %(prog)s videos/ --manifest                 # Redo outputs whose source changed
+  %(prog)s videos/ --dry-run                  # List files that would be converted
+  %(prog)s videos/ --backend av               # Convert in-process with PyAV
+  %(prog)s videos/ --jobs 2                   # Convert 2 files at a time
         """
     )
 
@@ -251,8 +867,74 @@ Examples:
         action="store_true",
         help="Force re-conversion even if output file exists"
     )
+    parser.add_argument(
+        "--force-reencode",
+        action="store_true",
+        help="Always re-encode audio, even when the source codec could be "
+             "copied as-is (e.g. AAC into m4a)"
+    )
+    parser.add_argument(
+        "--hwaccel",
+        choices=HWACCELS,
+        default="none",
+        help="Hardware decoding for the input (default: none). Audio "
+             "extraction never decodes video, so this only matters for "
+             "inputs where ffmpeg has to touch the video timeline"
+    )
+    parser.add_argument(
+        "--fast-probe",
+        action="store_true",
+        help="Analyze only the first 1 MB / 1 s of each input instead of "
+             "ffmpeg's 5 MB / 5 s. Cuts per-file startup on many short files; "
+             "leave off for unusual containers whose audio starts late"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1,
+        help="Number of files each ffmpeg process extracts (default: 1). "
+             "Larger batches amortize process startup across files, which "
+             "pays off on many short videos and on Windows"
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        help="Kill ffmpeg if a single file takes longer than this many "
+             "seconds (default: no limit)"
+    )
+    parser.add_argument(
+        "--manifest",
+        action="store_true",
+        help=f"Keep a {MANIFEST_NAME} in the output folder recording each "
+             "output's source size and mtime; outputs whose source has "
+             "changed since are converted again"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print the files that would be converted, one per line, "
+             "without running ffmpeg"
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["ffmpeg", "av"],
+        default="ffmpeg",
+        help="ffmpeg (default): run the ffmpeg tool per file. av: convert "
+             "in-process with PyAV (pip install av), saving the per-file "
+             "process startup; --hwaccel, --fast-probe, --batch-size and "
+             "--timeout apply to ffmpeg only"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of files to convert in parallel (default: CPU count). "
+             "Each ffmpeg gets an equal share of the cores."
+    )
 
     args = parser.parse_args()
+    if args.timeout is not None and args.timeout <= 0:
+        parser.error("--timeout must be a positive number of seconds")
 
     # Get list of video files to process
     video_files = get_video_files(args.path, args.file)
@@ -273,49 +955,168 @@ Examples:
         else:
             output_dir = args.path
 
-    print(f"Found {len(video_files)} video file(s) to convert")
-    print(f"Output format: {args.format}")
-    print(f"Output directory: {os.path.abspath(output_dir)}")
-    print(f"Bitrate: {args.bitrate}\n")
+    # --dry-run keeps stdout to the bare file list
+    if not args.dry_run:
+        print(f"Found {len(video_files)} video file(s) to convert")
+        print(f"Output format: {args.format}")
+        print(f"Output directory: {os.path.abspath(output_dir)}")
+        print(f"Bitrate: {args.bitrate}\n")
 
     # Process each video file
-    successful = 0
-    failed = 0
-    skipped = 0
+    counts = Counter()
     start_time = time.time()
 
-    for video_path in tqdm(video_files, desc="Converting videos", unit="file"):
-        result = convert_video_to_audio(
-            video_path,
-            output_dir,
-            args.format,
-            args.bitrate,
-            args.force
-        )
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    manifest = load_manifest(manifest_path) if args.manifest else {}
+    manifest_changed = False
 
-        if result:
-            # Check if it was actually converted or skipped
-            base_name = os.path.splitext(os.path.basename(video_path))[0]
-            output_path = os.path.join(output_dir, f"{base_name}.{args.format}")
+    # Drop files whose audio already exists before dispatching, so an
+    # incremental re-run doesn't pay a worker round-trip per finished file.
+    # One scandir of the output folder answers every lookup.
+    pending = video_files
+    stale = set()  # Outputs to redo because their source changed since
+    if not args.force:
+        try:
+            with os.scandir(output_dir) as entries:
+                existing = {entry.name for entry in entries}
+        except FileNotFoundError:
+            existing = set()
+        pending = []
+        for video_path in video_files:
+            name = audio_filename(video_path, args.format)
+            if name not in existing:
+                pending.append(video_path)
+                continue
+            # Only an entry for this same source can mark the output stale;
+            # outputs the manifest doesn't know about are kept as before.
+            entry = manifest.get(name)
+            fingerprint = source_fingerprint(video_path) if entry else None
+            if entry and entry.get("source") == fingerprint["source"] and entry != fingerprint:
+                stale.add(video_path)
+                pending.append(video_path)
+            else:
+                counts[Result.SKIPPED] += 1
+        if counts[Result.SKIPPED] and not args.dry_run:
+            print(f"⏭️  Skipping {counts[Result.SKIPPED]} file(s) already converted\n")
+        if stale and not args.dry_run:
+            print(f"♻️  Re-converting {len(stale)} file(s) whose source changed\n")
 
-            # Simple heuristic: if file existed before and we didn't force, it was skipped
-            if not args.force and "Skipping" in str(result):
-                skipped += 1
+    if args.dry_run:
+        for video_path in pending:
+            print(video_path)
+        return
+
+    # Each ffmpeg run is independent, so fan them out across processes.
+    # With --batch-size, each run extracts a group of files. Capped by
+    # group count so small batches don't start idle workers, and each
+    # ffmpeg gets cpu_count // jobs threads.
+    use_av = args.backend == "av"
+    if pending and use_av:
+        try:
+            _import_av()
+        except RuntimeError as e:
+            print(f"❌ Error: {e}")
+            sys.exit(1)
+    elif pending and not binary_found("ffmpeg"):
+        print("❌ Error: ffmpeg not found. Please install ffmpeg first.")
+        print("   macOS: brew install ffmpeg")
+        print("   Ubuntu/Debian: apt-get install ffmpeg")
+        sys.exit(1)
+    hwaccel = resolve_hwaccel(args.hwaccel) if pending and not use_av else None
+    if args.batch_size > 1 and not use_av:
+        groups = batch_groups(pending, args.batch_size)
+    else:
+        groups = [[video_path] for video_path in pending]
+    jobs = max(1, min(len(groups), args.jobs))
+    threads = max(1, (os.cpu_count() or 1) // jobs)
+    if groups:
+        # Shared by every single-file ffmpeg run; built here once rather
+        # than per file or per worker
+        command_parts = None if use_av else _command_parts(threads, hwaccel, args.fast_probe)
+        tasks = []  # (group, convert, args, kwargs)
+        for group in groups:
+            # Stale outputs exist on disk, so their conversion must overwrite
+            force = args.force or not stale.isdisjoint(group)
+            options = (output_dir, args.format, args.bitrate, force, threads,
+                       args.force_reencode, hwaccel, args.fast_probe, args.timeout)
+            if use_av:
+                tasks.append((group, convert_with_av, (group[0], output_dir, args.format,
+                              args.bitrate, force, args.force_reencode), {}))
+            elif len(group) == 1:
+                # Bars from parallel workers would overwrite each other.
+                tasks.append((group, convert_video_to_audio, (group[0], *options),
+                              {"progress": jobs == 1, "command_parts": command_parts}))
             else:
-                successful += 1
-        else:
-            failed += 1
+                tasks.append((group, convert_batch, (group, *options), {}))
+
+        # A single file gets no overall bar (it would be one tick), which
+        # also spares the tqdm import on the common one-file invocation.
+        pbar = None
+        if len(pending) > 1:
+            from tqdm import tqdm
+            # Throttled so thousands of quick files don't redraw per file
+            pbar = tqdm(total=len(pending), desc="Converting videos", unit="file",
+                        miniters=max(1, len(pending) // 200), mininterval=0.5)
+        # Messages go above the bar rather than through it
+        write = pbar.write if pbar else print
+
+        def completed():
+            """Yield (group, results) as each task finishes."""
+            if jobs == 1:
+                # Nothing to overlap: run in this process and skip the
+                # cost of starting a worker and pickling each task to it
+                for group, convert, convert_args, kwargs in tasks:
+                    yield group, convert(*convert_args, log=write, **kwargs)
+                return
+            # Workers reuse this process's ffmpeg/ffprobe lookup and encoder
+            # choice instead of each walking PATH and probing ffmpeg again
+            # (spawned workers start with empty state).
+            binaries = {name: binary(name) for name in ("ffmpeg", "ffprobe")}
+            codecs = {} if use_av else {args.format: audio_codec(args.format)}
+            with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                     initargs=(binaries, codecs)) as executor:
+                # Parallel workers hand their messages back for main() to write
+                futures = {
+                    executor.submit(_collect_messages, convert, *convert_args, **kwargs): group
+                    for group, convert, convert_args, kwargs in tasks
+                }
+                for future in as_completed(futures):
+                    results, messages = future.result()
+                    for message in messages:
+                        write(message)
+                    yield futures[future], results
+
+        try:
+            for group, results in completed():
+                if len(group) == 1:
+                    results = [results]
+
+                counts.update(results)
+                if args.manifest:
+                    for video_path, result in zip(group, results):
+                        if result is Result.CONVERTED:
+                            name = audio_filename(video_path, args.format)
+                            manifest[name] = source_fingerprint(video_path)
+                            manifest_changed = True
+                if pbar:
+                    pbar.update(len(group))
+        finally:
+            if pbar:
+                pbar.close()
+            # Saved even after an interrupt, so finished conversions count
+            if manifest_changed:
+                save_manifest(manifest_path, manifest)
 
     # Print summary
     elapsed = time.time() - start_time
     print(f"\n{'='*50}")
     print(f"Summary:")
     print(f"  Total files: {len(video_files)}")
-    print(f"  ✅ Converted: {successful}")
-    if skipped > 0:
-        print(f"  ⏭️  Skipped: {len(video_files) - successful - failed}")
-    if failed > 0:
-        print(f"  ❌ Failed: {failed}")
+    print(f"  ✅ Converted: {counts[Result.CONVERTED]}")
+    if counts[Result.SKIPPED] > 0:
+        print(f"  ⏭️  Skipped: {counts[Result.SKIPPED]}")
+    if counts[Result.FAILED] > 0:
+        print(f"  ❌ Failed: {counts[Result.FAILED]}")
     print(f"  ⏱️  Total time: {elapsed:.1f} seconds")
     print(f"  📁 Output directory: {os.path.abspath(output_dir)}")
     print(f"{'='*50}")
@@ -323,7 +1124,7 @@ Examples:
     # Surface conversion failures to callers (transcribe_one.sh treats
     # a non-zero exit as "give up on this job"). Without this, a failed
     # ffmpeg run was indistinguishable from success at the shell level.
-    if failed > 0:
+    if counts[Result.FAILED] > 0:
         sys.exit(1)
 
 if __name__ == "__main__":